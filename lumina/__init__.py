@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from dotenv import load_dotenv
+
+# Modules read their settings from the environment when imported, so `.env` is loaded before any of them,
+# whichever entry point imports the package first (run.py, aerich or the scripts)
+load_dotenv()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from lumina.models import BackfillCheckpoint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from tortoise import Model
+    from tortoise.queryset import QuerySet
+
+BACKFILL_BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "500"))
+"""How many rows a backfill updates per transaction."""
+BACKFILL_PAUSE = int(os.getenv("BACKFILL_PAUSE_MS", "100")) / 1000
+"""How long, in seconds, a backfill sleeps between batches so other writers can take the database lock."""
+
+
+async def run_backfill[M: Model](
+    name: str,
+    query: QuerySet[M],
+    update: Callable[[M], object],
+    *,
+    fields: Sequence[str],
+    batch_size: int = BACKFILL_BATCH_SIZE,
+    pause: float = BACKFILL_PAUSE,
+) -> None:
+    """Fill in a column of an existing table online, in small batches ordered by primary key.
+
+    Use this instead of an UPDATE in an aerich migration when the table may be large: the migration only
+    adds the nullable column, and this runs after startup while the bot keeps serving. Progress is stored in
+    a `BackfillCheckpoint` row after every batch, so a restarted backfill resumes where it stopped and a
+    finished one is skipped.
+
+    Args:
+        name: Unique name of the backfill, used as the checkpoint key.
+        query: The rows to update, must not be ordered or limited.
+        update: Called with each row to set the new values in place.
+        fields: The fields `update` sets.
+        batch_size: How many rows to update per batch.
+        pause: How long to sleep between batches.
+    """
+    pk_attr = query.model._meta.pk_attr
+    checkpoint, _ = await BackfillCheckpoint.get_or_create(name=name)
+    if checkpoint.done:
+        return
+
+    remaining = await query.filter(pk__gt=checkpoint.last_id).count()
+    if remaining:
+        logger.info(f"Backfill {name}: {remaining} rows to update, resuming after pk {checkpoint.last_id}")
+    start = time.perf_counter()
+    processed = 0
+
+    while True:
+        rows = await query.filter(pk__gt=checkpoint.last_id).order_by(pk_attr).limit(batch_size)
+        if not rows:
+            break
+
+        for row in rows:
+            update(row)
+        await query.model.bulk_update(rows, fields=fields)
+
+        processed += len(rows)
+        checkpoint.last_id = rows[-1].pk
+        checkpoint.processed += len(rows)
+        await checkpoint.save(update_fields=("last_id", "processed", "updated_at"))
+
+        elapsed = time.perf_counter() - start
+        total = max(remaining, processed)
+        logger.info(
+            f"Backfill {name}: {processed}/{total} rows ({processed / total:.0%}), {processed / elapsed:.0f} rows/s"
+        )
+        await asyncio.sleep(pause)
+
+    checkpoint.done = True
+    await checkpoint.save(update_fields=("done", "updated_at"))
+    if processed:
+        logger.info(f"Backfill {name} finished, updated {processed} rows in {time.perf_counter() - start:.1f}s")
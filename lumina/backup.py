@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import gzip
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import anyio
+from loguru import logger
+
+BACKUP_DIR = Path(os.getenv("BACKUP_DIR", "backups"))
+"""Where database snapshots are written."""
+BACKUP_INTERVAL = int(os.getenv("BACKUP_INTERVAL_HOURS", "24"))
+"""How often, in hours, a snapshot is taken automatically, 0 to only take them with the backup command."""
+BACKUP_RETENTION = int(os.getenv("BACKUP_RETENTION", "7"))
+"""How many snapshots are kept, older ones are deleted after each backup."""
+BACKUP_COMPRESS = os.getenv("BACKUP_COMPRESS", "true").lower() in {"1", "true", "yes"}
+"""Whether snapshots are gzipped."""
+
+
+class BackupResult(NamedTuple):
+    path: Path
+    pages: int
+    size: int
+    duration: float
+
+    def __str__(self) -> str:
+        pages_per_second = self.pages / self.duration if self.duration else self.pages
+        return (
+            f"{self.path} ({self.size / 1024 / 1024:.1f} MiB, {self.pages} pages) "
+            f"in {self.duration:.2f}s, {pages_per_second:.0f} pages/s"
+        )
+
+
+def _backup(source_path: str, dest: Path, *, compress: bool) -> BackupResult:
+    start = time.perf_counter()
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(dest)
+    try:
+        # One step copies every page under a single read transaction, in WAL mode writers carry on meanwhile
+        # and the snapshot is consistent, stepping would restart the copy whenever a write lands between steps
+        source.backup(target, pages=-1)
+        pages: int = target.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        target.close()
+        source.close()
+
+    if compress:
+        compressed = dest.with_name(f"{dest.name}.gz")
+        with dest.open("rb") as f_in, gzip.open(compressed, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        dest.unlink()
+        dest = compressed
+
+    return BackupResult(dest, pages, dest.stat().st_size, time.perf_counter() - start)
+
+
+def _rotate(directory: Path, *, keep: int) -> list[Path]:
+    snapshots = sorted(directory.glob("lumina-*.db*"), reverse=True)
+    removed = snapshots[keep:]
+    for path in removed:
+        path.unlink()
+    return removed
+
+
+async def create_backup(source_path: str) -> BackupResult:
+    """Take a consistent snapshot of the SQLite database in a thread and rotate old snapshots."""
+    await anyio.Path(BACKUP_DIR).mkdir(parents=True, exist_ok=True)
+    dest = BACKUP_DIR / f"lumina-{datetime.datetime.now(datetime.UTC):%Y%m%d-%H%M%S}.db"
+
+    result = await asyncio.to_thread(_backup, source_path, dest, compress=BACKUP_COMPRESS)
+    removed = await asyncio.to_thread(_rotate, BACKUP_DIR, keep=BACKUP_RETENTION)
+    logger.info(f"Backed up database to {result}, removed {len(removed)} old snapshots")
+    return result
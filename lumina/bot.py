@@ -7,75 +7,37 @@ from typing import TYPE_CHECKING
 import anyio
 import discord
 from discord.ext import commands
-from discord.utils import sleep_until
 from loguru import logger
 from tortoise import Tortoise
 
-from lumina.cogs.reminder import SnoozeView
+from lumina.cogs.reminder import DetachedSnoozeButton, DigestSnoozeSelect
 from lumina.command_tree import CommandTree
-from lumina.constants import DEFAULT_LOCALE
+from lumina.constants import DELIVERY_COGS, Role
+from lumina.db import TORTOISE_CONFIG
+from lumina.dispatcher import Lane, dispatcher
 from lumina.error_handler import create_error_embed
 from lumina.l10n import AppCommandTranslator, translator
-from lumina.models import Reminder
+from lumina.scheduler import ReminderScheduler
+from lumina.write_queue import write_queue
 
 if TYPE_CHECKING:
-    from lumina.embeds import ErrorEmbed
-
-# Use /app/data/lumina.db in containers, lumina.db locally
-DB_PATH = os.getenv("DB_PATH", "lumina.db")
-
-TORTOISE_CONFIG = {
-    "connections": {"default": f"sqlite://{DB_PATH}"},
-    "apps": {"models": {"models": ["lumina.models", "aerich.models"], "default_connection": "default", "use_tz": True}},
-}
-
-
-class ReminderScheduler:
-    def __init__(self, bot: Lumina) -> None:
-        self.bot = bot
-        self.current_task: asyncio.Task | None = None
-
-    async def send_reminder(self, reminder: Reminder) -> None:
-        logger.info(f"Sending reminder to {reminder.user_id}")
-        locale = reminder.user.locale or DEFAULT_LOCALE
-        embed = reminder.get_embed(locale)
-        view = SnoozeView(text=reminder.text, message_url=reminder.message_url, locale=locale)
-        message = await self.bot.dm_user(reminder.user_id, embed=embed, view=view)
-        if message is not None:
-            view.message = message
-            await reminder.delete()
-        else:
-            reminder.sent = True
-            await reminder.save()
-
-    async def get_next_reminder(self) -> Reminder | None:
-        return await Reminder.filter(sent=False).order_by("datetime").first().prefetch_related("user")
+    from collections.abc import Awaitable, Sequence
 
-    async def sleep_task(self, reminder: Reminder) -> None:
-        await sleep_until(reminder.datetime)
-        await self.send_reminder(reminder)
-        self.current_task = None
-        await self.schedule_reminder()
-
-    async def schedule_reminder(self) -> None:
-        self.cancel_task()
-
-        reminder = await self.get_next_reminder()
-        logger.debug(f"Next reminder: {reminder}")
-        if reminder is None:
-            return
+    from lumina.embeds import ErrorEmbed
+    from lumina.models import LuminaUser
 
-        self.current_task = asyncio.create_task(self.sleep_task(reminder))
 
-    def cancel_task(self) -> None:
-        if self.current_task is not None:
-            self.current_task.cancel()
-            self.current_task = None
+def _send(
+    channel: discord.abc.Messageable, *, embeds: Sequence[discord.Embed], view: discord.ui.View | None
+) -> Awaitable[discord.Message]:
+    return channel.send(embeds=embeds, view=view) if view is not None else channel.send(embeds=embeds)
 
 
 class Lumina(commands.Bot):
-    def __init__(self) -> None:
+    def __init__(self, *, role: Role = Role.ALL) -> None:
+        self.role = role
         self.scheduler = ReminderScheduler(self)
+        self._stopped = asyncio.Event()
 
         super().__init__(
             command_prefix=commands.when_mentioned,
@@ -97,10 +59,17 @@ class Lumina(commands.Bot):
     async def _setup_translator(self) -> None:
         await translator.load()
 
+    def _should_load_cog(self, cog_name: str) -> bool:
+        if cog_name == "health":
+            return os.getenv("ENV", "dev") != "dev"
+        if cog_name in DELIVERY_COGS:
+            return self.role is not Role.GATEWAY
+        return self.role is not Role.SCHEDULER
+
     async def _load_cogs(self) -> None:
         async for filepath in anyio.Path("lumina/cogs").glob("**/*.py"):
             cog_name = anyio.Path(filepath).stem
-            if os.getenv("ENV", "dev") == "dev" and cog_name == "health":
+            if not self._should_load_cog(cog_name):
                 continue
 
             try:
@@ -109,6 +78,9 @@ class Lumina(commands.Bot):
             except Exception:
                 logger.exception(f"Failed to load cog {cog_name}")
 
+        if self.role is Role.SCHEDULER:
+            return
+
         try:
             await self.load_extension("jishaku")
         except Exception:
@@ -122,26 +94,98 @@ class Lumina(commands.Bot):
         await self._load_cogs()
 
         await self.tree.set_translator(AppCommandTranslator())
-        await self.scheduler.schedule_reminder()
+        # Digest snooze selects are always handled by custom ID, whichever process delivered the digest
+        self.add_dynamic_items(DigestSnoozeSelect)
+        if self.role is Role.GATEWAY:
+            # Reminders are sent by the scheduler process, which can't receive their button clicks
+            self.add_dynamic_items(DetachedSnoozeButton)
+        else:
+            await self.scheduler.load()
+
+    async def start(self, token: str, *, reconnect: bool = True) -> None:
+        if self.role is not Role.SCHEDULER:
+            return await super().start(token, reconnect=reconnect)
+
+        # Only the HTTP client is needed to deliver notifications
+        await self.login(token)
+        await self._stopped.wait()
+        return None
+
+    def is_ready(self) -> bool:
+        if self.role is Role.SCHEDULER:
+            return self.user is not None
+        return super().is_ready()
+
+    async def wait_until_ready(self) -> None:
+        if self.role is Role.SCHEDULER:
+            return
+        await super().wait_until_ready()
 
     def create_error_embed(self, error: Exception, *, locale: discord.Locale) -> tuple[ErrorEmbed, bool]:
         return create_error_embed(error, locale=locale)
 
-    async def dm_user(
-        self, user_id: int, *, embed: discord.Embed, view: discord.ui.View | None = None
-    ) -> discord.Message | None:
+    async def open_dm(self, user: LuminaUser, *, lane: Lane) -> discord.abc.Messageable | None:
+        """Get a DM channel with a user, it is only opened the first time and its ID is stored for later deliveries."""
+        if user.dm_channel_id is not None:
+            return self.get_partial_messageable(user.dm_channel_id, type=discord.ChannelType.private)
+
         try:
-            user = await self.fetch_user(user_id)
-        except discord.NotFound:
-            logger.warning(f"Could not find user with ID {user_id}.")
+            channel = await dispatcher.run(lane, lambda: self.create_dm(discord.Object(id=user.id)))
+        except discord.HTTPException:
+            logger.warning(f"Could not open a DM channel with user {user.id}.")
             return None
 
+        user.dm_channel_id = channel.id
+        await write_queue.save(user, update_fields=("dm_channel_id",))
+        return channel
+
+    async def send_dm(
+        self,
+        user: LuminaUser,
+        channel: discord.abc.Messageable,
+        *,
+        embeds: Sequence[discord.Embed],
+        lane: Lane,
+        view: discord.ui.View | None = None,
+    ) -> discord.Message:
+        """Send a DM through a channel from `open_dm`, reopening the channel once if the stored one stopped working.
+
+        Raises:
+            discord.HTTPException: Sending failed.
+        """
         try:
-            return await user.send(embed=embed, view=view) if view is not None else await user.send(embed=embed)
+            return await dispatcher.run(lane, lambda: _send(channel, embeds=embeds, view=view))
+        except (discord.NotFound, discord.Forbidden):
+            if not isinstance(channel, discord.PartialMessageable):
+                raise
+
+            logger.info(f"Stored DM channel of user {user.id} stopped working, reopening it")
+            user.dm_channel_id = None
+            await write_queue.save(user, update_fields=("dm_channel_id",))
+            reopened = await self.open_dm(user, lane=lane)
+            if reopened is None:
+                raise
+            return await dispatcher.run(lane, lambda: _send(reopened, embeds=embeds, view=view))
+
+    async def dm_user(
+        self, user: LuminaUser, *, embeds: Sequence[discord.Embed], lane: Lane, view: discord.ui.View | None = None
+    ) -> discord.Message | None:
+        channel = await self.open_dm(user, lane=lane)
+        if channel is None:
+            return None
+        try:
+            return await self.send_dm(user, channel, embeds=embeds, lane=lane, view=view)
         except discord.Forbidden:
-            logger.warning(f"Could not DM {user}.")
+            logger.warning(f"Could not DM user {user.id}.")
             return None
 
     async def close(self) -> None:
+        self._stopped.set()
+        self.scheduler.cancel_task()
+        try:
+            await self.scheduler.release_leases()
+        except Exception:
+            logger.exception("Failed to release reminder leases")
+        await write_queue.drain()
         await Tortoise.close_connections()
         return await super().close()
@@ -4,7 +4,13 @@ from typing import TYPE_CHECKING
 
 from discord.ext import commands
 
+from lumina.backup import create_backup
+from lumina.db import get_sqlite_path
+from lumina.dispatcher import dispatcher
 from lumina.l10n import translator
+from lumina.models import user_cache
+from lumina.retention import vacuum_sqlite
+from lumina.write_queue import write_queue
 
 if TYPE_CHECKING:
     from lumina.bot import Lumina
@@ -28,6 +34,35 @@ class AdminCog(commands.Cog):
         await translator.load()
         await ctx.send("Reloaded translator.")
 
+    @commands.command(name="backup")
+    async def backup_command(self, ctx: commands.Context) -> None:
+        db_path = get_sqlite_path()
+        if db_path is None:
+            await ctx.send("Backups are only supported for SQLite, use the database server's tools instead.")
+            return
+
+        message = await ctx.send("Backing up database...")
+        result = await create_backup(db_path)
+        await message.edit(content=f"Backed up database to {result}.")
+
+    @commands.command(name="vacuum")
+    async def vacuum_command(self, ctx: commands.Context) -> None:
+        if get_sqlite_path() is None:
+            await ctx.send("VACUUM is only needed for SQLite.")
+            return
+
+        message = await ctx.send("Vacuuming database, writes wait until it finishes...")
+        freed = await vacuum_sqlite()
+        await message.edit(content=f"Vacuumed database, freed {freed} pages.")
+
+    @commands.command(name="stats")
+    async def stats_command(self, ctx: commands.Context) -> None:
+        await ctx.send(
+            f"User settings cache: {user_cache.get_stats()}\n"
+            f"Write queue: {write_queue.get_stats()}\n"
+            f"Dispatcher: {dispatcher.get_stats()}"
+        )
+
 
 async def setup(bot: Lumina) -> None:
     await bot.add_cog(AdminCog(bot))
@@ -11,7 +11,7 @@ from lumina.components import Button, Modal, Paginator, TextInput, View
 from lumina.embeds import DefaultEmbed
 from lumina.exceptions import DidNotSetBirthdayError, InvalidBirthdayInputError, InvalidInputError, NoBirthdaysError
 from lumina.l10n import LocaleStr, translator
-from lumina.models import Birthday, LuminaUser, get_locale, get_timezone
+from lumina.models import Birthday, LuminaUser, get_locale, get_lumina_user, get_timezone
 from lumina.types import UserOrMember  # noqa: TC001
 from lumina.utils import absolute_send, get_now, sort_birthdays_by_next
 
@@ -48,7 +48,10 @@ class NotifyButton(Button[LeapYearNotifyView]):
     async def callback(self, i: Interaction) -> None:
         self.view.birthday.leap_year_notify_month = self.month
         self.view.birthday.leap_year_notify_day = self.day
-        await self.view.birthday.save(update_fields=("leap_year_notify_month", "leap_year_notify_day"))
+        self.view.birthday.schedule_notifications(await get_timezone(i))
+        await self.view.birthday.save(
+            update_fields=("leap_year_notify_month", "leap_year_notify_day", "next_notify_at", "next_early_notify_at")
+        )
 
         embed = LuminaUser.get_settings_saved_embed(self.view.locale)
         await i.response.send_message(embed=embed, ephemeral=True)
@@ -98,7 +101,7 @@ class BirthdayCog(commands.GroupCog, name=app_commands.locale_str("birthday", ke
     async def see_birthday_ctx_menu(self, i: Interaction, user: UserOrMember) -> Any:
         await i.response.defer(ephemeral=True)
 
-        lumina_user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        lumina_user = await get_lumina_user(i)
         bday = await Birthday.get_or_none(lumina_user.id, user=user)
         if bday is None:
             msg = f"<@{user.id}>"
@@ -129,15 +132,18 @@ class BirthdayCog(commands.GroupCog, name=app_commands.locale_str("birthday", ke
         if day > num_days:
             raise InvalidInputError(str(day))
 
-        lumina_user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        lumina_user = await get_lumina_user(i)
         locale = await get_locale(i)
 
-        bday = await Birthday.create_or_update(lumina_user.id, month=month, day=day, user=user, name=name)
+        bday = await Birthday.create_or_update(
+            lumina_user.id, month=month, day=day, timezone=lumina_user.timezone, user=user, name=name
+        )
 
         # Set early notification if specified
         if notify_days_before is not None:
             bday.notify_days_before = notify_days_before if notify_days_before > 0 else None
-            await bday.save(update_fields=("notify_days_before",))
+            bday.schedule_notifications(lumina_user.timezone)
+            await bday.save(update_fields=("notify_days_before", "next_notify_at", "next_early_notify_at"))
 
         embeds = [
             bday.get_created_embed(
@@ -173,7 +179,7 @@ class BirthdayCog(commands.GroupCog, name=app_commands.locale_str("birthday", ke
         if (user is None and name is None) or (user is not None and name is not None):
             raise InvalidBirthdayInputError
 
-        lumina_user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        lumina_user = await get_lumina_user(i)
         bday = await Birthday.get_or_none(lumina_user.id, user=user, name=name)
         if bday is None:
             raise DidNotSetBirthdayError(f"<@{user.id}>" if user is not None else name)  # type: ignore[reportArgumentType]
@@ -264,15 +270,15 @@ class BirthdayCog(commands.GroupCog, name=app_commands.locale_str("birthday", ke
     async def birthday_list(self, i: Interaction) -> None:
         await i.response.defer(ephemeral=True)
 
-        birthdays = await Birthday.filter(user_id=i.user.id)
+        birthdays = await Birthday.owned_by(i.user.id)
         if not birthdays:
             raise NoBirthdaysError
 
-        now = get_now(await get_timezone(i.user.id))
+        timezone = await get_timezone(i)
+        now = get_now(timezone)
         birthdays = sort_birthdays_by_next(birthdays, now)
 
         split_birthdays = itertools.batched(birthdays, 10)
-        timezone = (await LuminaUser.get_or_create(id=i.user.id))[0].timezone
         locale = await get_locale(i)
         embeds: list[DefaultEmbed] = []
 
@@ -284,9 +290,11 @@ class BirthdayCog(commands.GroupCog, name=app_commands.locale_str("birthday", ke
 
     @birthday_remove.autocomplete("name")
     async def bday_name_autocomplete(self, i: Interaction, current: str) -> list[app_commands.Choice[str]]:
-        bdays = await Birthday.filter(
-            bday_username__isnull=False, bday_username__icontains=current, user_id=i.user.id, bday_user_id=0
-        ).limit(25)
+        bdays = (
+            await Birthday.owned_by(i.user.id)
+            .filter(bday_username__isnull=False, bday_username__icontains=current, bday_user_id=0)
+            .limit(25)
+        )
         return [app_commands.Choice(name=str(bday.bday_username), value=str(bday.bday_username)) for bday in bdays]
 
 
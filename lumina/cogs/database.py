@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from discord.ext import commands, tasks
+from loguru import logger
+from tortoise import connections
+
+from lumina.backup import BACKUP_INTERVAL, create_backup
+from lumina.db import get_sqlite_path
+
+if TYPE_CHECKING:
+    from lumina.bot import Lumina
+
+
+class DatabaseCog(commands.Cog):
+    def __init__(self, bot: Lumina, db_path: str) -> None:
+        self.bot = bot
+        self.db_path = db_path
+        self.wal_path = Path(f"{db_path}-wal")
+        self._last_wal_mtime: float | None = None
+
+    async def cog_load(self) -> None:
+        self.checkpoint_wal.start()
+        if BACKUP_INTERVAL > 0:
+            self.backup_database.start()
+
+    async def cog_unload(self) -> None:
+        self.checkpoint_wal.cancel()
+        self.backup_database.cancel()
+
+    @tasks.loop(hours=max(BACKUP_INTERVAL, 1))
+    async def backup_database(self) -> None:
+        try:
+            await create_backup(self.db_path)
+        except Exception:
+            logger.exception("Failed to back up the database")
+
+    @tasks.loop(minutes=5)
+    async def checkpoint_wal(self) -> None:
+        """Truncate the write-ahead log once no writes happened since the last run."""
+        try:
+            stat = self.wal_path.stat()
+        except FileNotFoundError:
+            return
+        if stat.st_size == 0:
+            return
+
+        last_mtime, self._last_wal_mtime = self._last_wal_mtime, stat.st_mtime
+        if stat.st_mtime != last_mtime:
+            # Still being written to, wait for a quiet period
+            return
+
+        start = time.perf_counter()
+        _, rows = await connections.get("default").execute_query("PRAGMA wal_checkpoint(TRUNCATE)")
+        busy = rows[0][0]
+        logger.info(
+            f"WAL checkpoint of {stat.st_size / 1024:.0f} KiB took {time.perf_counter() - start:.3f}s"
+            f"{', blocked by a reader or writer' if busy else ''}"
+        )
+
+
+async def setup(bot: Lumina) -> None:
+    db_path = get_sqlite_path()
+    if db_path is None:
+        return
+    await bot.add_cog(DatabaseCog(bot, db_path))
@@ -7,20 +7,26 @@ import dateparser
 import discord
 from discord import app_commands
 from discord.ext import commands
+from loguru import logger
 
 from lumina.components import Button, Modal, Paginator, TextInput, View
+from lumina.dispatcher import Lane, dispatcher
 from lumina.exceptions import InvalidInputError, NoRemindersError, NotFutureTimeError, ReminderNotFoundError
 from lumina.l10n import LocaleStr, translator
-from lumina.models import LuminaUser, Reminder, get_locale, get_timezone
-from lumina.utils import get_now, shorten_text, split_list_to_chunks
+from lumina.models import Reminder, get_locale, get_lumina_user, get_timezone
+from lumina.utils import absolute_send, get_now, shorten_text, split_list_to_chunks
+from lumina.write_queue import write_queue
 
 if TYPE_CHECKING:
     import datetime
+    from collections.abc import Sequence
 
     from lumina.bot import Lumina
     from lumina.embeds import DefaultEmbed
     from lumina.types import Interaction
 
+MESSAGE_URL_PREFIX = "https://discord.com/channels/"
+
 
 class ReminderModal(Modal):
     time = TextInput(
@@ -28,41 +34,188 @@ class ReminderModal(Modal):
     )
 
 
+async def snooze(i: Interaction, *, text: str, message_url: str | None) -> bool:
+    """Ask the user when to be reminded again and create a new reminder.
+
+    Returns:
+        Whether a new reminder was created.
+    """
+    locale = await get_locale(i)
+
+    modal = ReminderModal(title=LocaleStr("reminder_snooze_modal_title"))
+    modal.translate(locale)
+
+    await i.response.send_modal(modal)
+    await modal.wait()
+    if modal.incomplete:
+        return False
+
+    timezone = await get_timezone(i)
+    dt = ReminderCog.natural_language_to_dt(modal.time.value, timezone)
+
+    user = await get_lumina_user(i)
+    reminder = await write_queue.create(Reminder, text=text, datetime=dt, user=user, message_url=message_url)
+    i.client.scheduler.add_reminder(reminder)
+
+    await i.followup.send(embed=reminder.get_created_embed(locale), ephemeral=True)
+    return True
+
+
+async def snooze_delivered(
+    i: Interaction, item: discord.ui.Item, *, reminder_id: int | None, path: str | None, fallback_text: str
+) -> bool:
+    """Snooze a reminder from a component that any process may receive the interaction of.
+
+    The text and message URL are read from the reminder's row, delivered reminders are kept until
+    retention purges them. Purged reminders, or components sent before the ID was included, fall
+    back to the given text, which is shortened, and the message URL path. Errors are reported to
+    the user, as there's no view to handle them.
+
+    Returns:
+        Whether a new reminder was created.
+    """
+    reminder = None
+    if reminder_id is not None:
+        reminder = await Reminder.get_or_none(id=reminder_id, user_id=i.user.id)
+    if reminder is not None:
+        text, message_url = reminder.text, reminder.message_url
+    else:
+        text = fallback_text
+        message_url = None if path is None else f"{MESSAGE_URL_PREFIX}{path}"
+
+    try:
+        return await snooze(i, text=text, message_url=message_url)
+    except Exception as e:
+        embed, recognized = i.client.create_error_embed(e, locale=i.locale)
+        if not recognized:
+            logger.exception(f"An unrecognized error occurred in {item.__class__.__name__}.")
+        await absolute_send(i, embed=embed, ephemeral=True)
+        return False
+
+
 class SnoozeButton(Button["SnoozeView"]):
-    def __init__(self) -> None:
-        super().__init__(label=LocaleStr("reminder_snooze_button_label"), style=discord.ButtonStyle.blurple)
+    def __init__(self, *, reminder_id: int, message_url: str | None) -> None:
+        super().__init__(
+            label=LocaleStr("reminder_snooze_button_label"),
+            style=discord.ButtonStyle.blurple,
+            custom_id=DetachedSnoozeButton.build_custom_id(reminder_id, message_url),
+        )
 
     async def callback(self, i: Interaction) -> Any:
-        locale = await get_locale(i)
+        if not await snooze(i, text=self.view.text, message_url=self.view.message_url):
+            return
 
-        modal = ReminderModal(title=LocaleStr("reminder_snooze_modal_title"))
-        modal.translate(locale)
+        self.disabled = True
+        message = self.view.message
+        if message is not None:
+            await dispatcher.run(Lane.EDIT, lambda: message.edit(view=self.view))
 
-        await i.response.send_modal(modal)
-        await modal.wait()
-        if modal.incomplete:
+
+class SnoozeView(View):
+    def __init__(self, reminder: Reminder, *, locale: discord.Locale) -> None:
+        super().__init__(locale, timeout=300)
+        self.text = reminder.text
+        self.message_url = reminder.message_url
+        self.add_item(SnoozeButton(reminder_id=reminder.id, message_url=reminder.message_url))
+
+
+class DetachedSnoozeButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"lumina:snooze(?::(?P<reminder_id>\d+)(?=:|$))?(?::(?P<path>[\w@/]+))?",
+):
+    """Handles snooze buttons on reminders that were delivered by a separate scheduler process.
+
+    That process can't receive interactions, so the gateway process picks them up by custom ID.
+    The custom ID holds the reminder ID and the message URL path, see `snooze_delivered`.
+    """
+
+    def __init__(self, reminder_id: int | None, path: str | None) -> None:
+        super().__init__(discord.ui.Button(custom_id=self.build_custom_id(reminder_id, None, path=path)))
+        self.reminder_id = reminder_id
+        self.path = path
+
+    @staticmethod
+    def build_custom_id(reminder_id: int | None, message_url: str | None, *, path: str | None = None) -> str:
+        if message_url is not None and message_url.startswith(MESSAGE_URL_PREFIX):
+            path = message_url.removeprefix(MESSAGE_URL_PREFIX)
+        parts = ["lumina:snooze"]
+        if reminder_id is not None:
+            parts.append(str(reminder_id))
+        if path is not None:
+            parts.append(path)
+        return ":".join(parts)
+
+    @classmethod
+    async def from_custom_id(cls, _: Interaction, __: discord.ui.Button, match: re.Match[str]) -> DetachedSnoozeButton:
+        reminder_id = match["reminder_id"]
+        return cls(None if reminder_id is None else int(reminder_id), match["path"])
+
+    async def callback(self, i: Interaction) -> Any:
+        if i.message is None or not i.message.embeds:
             return
 
-        timezone = await get_timezone(i.user.id)
-        dt = ReminderCog.natural_language_to_dt(modal.time.value, timezone)
+        if not await snooze_delivered(
+            i, self, reminder_id=self.reminder_id, path=self.path, fallback_text=i.message.embeds[0].title or ""
+        ):
+            return
 
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        reminder = await Reminder.create(text=self.view.text, datetime=dt, user=user, message_url=self.view.message_url)
-        await i.client.scheduler.schedule_reminder()
+        view = discord.ui.View.from_message(i.message)
+        for item in view.children:
+            if isinstance(item, discord.ui.Button):
+                item.disabled = True
+        message = i.message
+        await dispatcher.run(Lane.EDIT, lambda: message.edit(view=view))
 
-        self.disabled = True
-        if self.view.message is not None:
-            await self.view.message.edit(view=self.view)
 
-        await i.followup.send(embed=reminder.get_created_embed(locale), ephemeral=True)
+class DigestSnoozeSelect(discord.ui.DynamicItem[discord.ui.Select], template=r"lumina:digest_snooze"):
+    """Snoozes one reminder of a digest, a message that delivers several reminders of a user at once.
 
+    Like `DetachedSnoozeButton`, it works in whichever process receives the interaction. Each option
+    value holds the position of the reminder's embed, whose title is the fallback text, the reminder
+    ID and the path of its message URL.
+    """
 
-class SnoozeView(View):
-    def __init__(self, *, text: str, message_url: str | None, locale: discord.Locale) -> None:
-        super().__init__(locale, timeout=300)
-        self.text = text
-        self.message_url = message_url
-        self.add_item(SnoozeButton())
+    OPTION_VALUE = re.compile(r"(?P<index>\d+)(?::(?P<reminder_id>\d+)(?=:|$))?(?::(?P<path>[\w@/]+))?")
+
+    def __init__(self, select: discord.ui.Select) -> None:
+        super().__init__(select)
+
+    @classmethod
+    def build(cls, reminders: Sequence[Reminder], *, locale: discord.Locale) -> DigestSnoozeSelect:
+        options: list[discord.SelectOption] = []
+        for index, reminder in enumerate(reminders):
+            ids = DetachedSnoozeButton.build_custom_id(reminder.id, reminder.message_url).removeprefix("lumina:snooze")
+            options.append(discord.SelectOption(label=shorten_text(reminder.text, 100), value=f"{index}{ids}"))
+
+        return cls(
+            discord.ui.Select(
+                custom_id="lumina:digest_snooze",
+                placeholder=translator.translate(LocaleStr("reminder_digest_snooze_placeholder"), locale=locale),
+                options=options,
+            )
+        )
+
+    @classmethod
+    async def from_custom_id(cls, _: Interaction, item: discord.ui.Select, __: re.Match[str]) -> DigestSnoozeSelect:
+        return cls(item)
+
+    async def callback(self, i: Interaction) -> Any:
+        if i.message is None or not self.item.values:
+            return
+
+        match = self.OPTION_VALUE.fullmatch(self.item.values[0])
+        if match is None:
+            return
+
+        index, reminder_id = int(match["index"]), match["reminder_id"]
+        embeds = i.message.embeds
+        await snooze_delivered(
+            i,
+            self,
+            reminder_id=None if reminder_id is None else int(reminder_id),
+            path=match["path"],
+            fallback_text=(embeds[index].title or "") if index < len(embeds) else "",
+        )
 
 
 class ReminderCog(commands.GroupCog, name=app_commands.locale_str("reminder", key="reminder_group_name")):  # type: ignore
@@ -107,17 +260,18 @@ class ReminderCog(commands.GroupCog, name=app_commands.locale_str("reminder", ke
         if modal.incomplete:
             return
 
-        timezone = await get_timezone(i.user.id)
+        timezone = await get_timezone(i)
         dt = self.natural_language_to_dt(modal.time.value, timezone)
 
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        reminder = await Reminder.create(
+        user = await get_lumina_user(i)
+        reminder = await write_queue.create(
+            Reminder,
             text=message.content or translator.translate(LocaleStr("no_content"), locale=locale),
             datetime=dt,
             user=user,
             message_url=message.jump_url,
         )
-        await self.bot.scheduler.schedule_reminder()
+        self.bot.scheduler.add_reminder(reminder)
 
         await i.followup.send(embed=reminder.get_created_embed(locale), ephemeral=True)
 
@@ -138,12 +292,12 @@ class ReminderCog(commands.GroupCog, name=app_commands.locale_str("reminder", ke
     async def reminder_set(self, i: Interaction, when: str, text: str) -> None:
         await i.response.defer(ephemeral=True)
 
-        timezone = await get_timezone(i.user.id)
+        timezone = await get_timezone(i)
         dt = self.natural_language_to_dt(when, timezone)
 
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        reminder = await Reminder.create(text=text, datetime=dt, user=user)
-        await self.bot.scheduler.schedule_reminder()
+        user = await get_lumina_user(i)
+        reminder = await write_queue.create(Reminder, text=text, datetime=dt, user=user)
+        self.bot.scheduler.add_reminder(reminder)
 
         await i.followup.send(embed=reminder.get_created_embed(await get_locale(i)), ephemeral=True)
 
@@ -161,14 +315,14 @@ class ReminderCog(commands.GroupCog, name=app_commands.locale_str("reminder", ke
             raise ReminderNotFoundError
 
         await reminder.delete()
-        await self.bot.scheduler.schedule_reminder()
+        self.bot.scheduler.remove_reminder(reminder.id)
 
         await i.response.send_message(embed=reminder.get_removed_embed(await get_locale(i)), ephemeral=True)
 
     @reminder_remove.autocomplete("reminder_id")
     async def reminder_id_autocomplete(self, i: Interaction, current: str) -> list[app_commands.Choice[int]]:
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        reminders = await Reminder.filter(user=user).all()
+        user = await get_lumina_user(i)
+        reminders = await Reminder.pending(user.id)
 
         if not reminders:
             return [
@@ -190,8 +344,8 @@ class ReminderCog(commands.GroupCog, name=app_commands.locale_str("reminder", ke
     async def reminder_list(self, i: Interaction) -> None:
         await i.response.defer(ephemeral=True)
 
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        reminders = await Reminder.filter(user=user).all().order_by("datetime")
+        user = await get_lumina_user(i)
+        reminders = await Reminder.pending(user.id)
         if not reminders:
             raise NoRemindersError
 
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from discord.ext import commands, tasks
+from loguru import logger
+
+from lumina.db import get_sqlite_path
+from lumina.retention import run_retention
+
+if TYPE_CHECKING:
+    from lumina.bot import Lumina
+
+
+class RetentionCog(commands.Cog):
+    def __init__(self, bot: Lumina) -> None:
+        self.bot = bot
+
+    async def cog_load(self) -> None:
+        self.apply_retention.start()
+
+    async def cog_unload(self) -> None:
+        self.apply_retention.cancel()
+
+    @tasks.loop(hours=1)
+    async def apply_retention(self) -> None:
+        try:
+            await run_retention(sqlite=get_sqlite_path() is not None)
+        except Exception:
+            logger.exception("Failed to apply retention policies")
+
+
+async def setup(bot: Lumina) -> None:
+    await bot.add_cog(RetentionCog(bot))
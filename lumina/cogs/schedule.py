@@ -1,144 +1,171 @@
 from __future__ import annotations
 
-import calendar
-import contextlib
-from datetime import timedelta
-from typing import TYPE_CHECKING
+import asyncio
+import datetime
+import itertools
+import os
+import time
+from typing import TYPE_CHECKING, NamedTuple
 
-import discord
 from discord.ext import commands, tasks
 from loguru import logger
+from tortoise.transactions import in_transaction
 
-from lumina.constants import DEFAULT_LOCALE
-from lumina.models import Birthday, LuminaUser
+from lumina.backfill import run_backfill
+from lumina.constants import DEFAULT_LOCALE, MAX_EMBEDS_PER_MESSAGE
+from lumina.dispatcher import Lane
+from lumina.models import Birthday, DiscordProfile
+from lumina.profiles import get_profiles, refresh_upcoming_profiles
 from lumina.utils import get_now
 
 if TYPE_CHECKING:
     from lumina.bot import Lumina
-    from lumina.types import UserOrMember
+    from lumina.embeds import DefaultEmbed
+
+BIRTHDAY_CONCURRENCY = int(os.getenv("BIRTHDAY_CONCURRENCY", "10"))
+"""How many users can be sent their birthday notifications at the same time."""
+RETRY_DELAY = datetime.timedelta(hours=1)
+"""How long to wait before retrying a birthday notification that could not be delivered."""
+
+
+class DueNotification(NamedTuple):
+    birthday: Birthday
+    early: bool
 
 
 class ScheduleCog(commands.Cog):
     def __init__(self, bot: Lumina) -> None:
         self.bot = bot
+        self._semaphore = asyncio.Semaphore(BIRTHDAY_CONCURRENCY)
 
     async def cog_load(self) -> None:
         self.notify_birthdays.start()
+        self.refresh_profiles.start()
 
     async def cog_unload(self) -> None:
         self.notify_birthdays.cancel()
-
-    async def _get_bday_user(self, birthday: Birthday) -> UserOrMember | None:
-        bday_user: UserOrMember | None = None
-        if birthday.bday_user_id != 0:
-            with contextlib.suppress(discord.NotFound):
-                bday_user = self.bot.get_user(birthday.bday_user_id) or await self.bot.fetch_user(birthday.bday_user_id)
-        return bday_user
-
-    async def _send_regular_notification(self, birthday: Birthday) -> None:
-        """Send a regular birthday notification on the day of the birthday."""
-        logger.info(f"Sending birthday reminder to {birthday.user_id}")
-        await birthday.fetch_related("user")
-
-        bday_user = await self._get_bday_user(birthday)
-
-        embed = birthday.get_embed(birthday.user.locale or DEFAULT_LOCALE, user=bday_user)
-        success = await self.bot.dm_user(birthday.user_id, embed=embed)
-        if success:
-            user = await LuminaUser.get(id=birthday.user_id)
-            birthday.last_notify_year = get_now(user.timezone).year
-            await birthday.save(update_fields=("last_notify_year",))
-
-    async def _send_early_notification(self, birthday: Birthday, days_before: int) -> None:
-        """Send an early birthday notification X days before the birthday."""
-        logger.info(f"Sending early birthday reminder to {birthday.user_id} ({days_before} days before)")
-        await birthday.fetch_related("user")
-
-        bday_user = await self._get_bday_user(birthday)
-
-        embed = birthday.get_early_notification_embed(
-            birthday.user.locale or DEFAULT_LOCALE, user=bday_user, days_before=days_before
-        )
-        success = await self.bot.dm_user(birthday.user_id, embed=embed)
-        if success:
-            user = await LuminaUser.get(id=birthday.user_id)
-            birthday.last_early_notify_year = get_now(user.timezone).year
-            await birthday.save(update_fields=("last_early_notify_year",))
-
-    @tasks.loop(hours=1)
+        self.refresh_profiles.cancel()
+
+    def _get_embed(self, notification: DueNotification, bday_user: DiscordProfile | None) -> DefaultEmbed:
+        birthday = notification.birthday
+        locale = birthday.user.locale or DEFAULT_LOCALE
+        # Named birthdays are shown by their name, the profile's avatar would belong to someone else
+        avatar_url = bday_user.avatar_url if bday_user is not None and birthday.bday_username is None else None
+        if notification.early and birthday.notify_days_before is not None:
+            return birthday.get_early_notification_embed(
+                locale, user=bday_user, days_before=birthday.notify_days_before, avatar_url=avatar_url
+            )
+        return birthday.get_embed(locale, user=bday_user, avatar_url=avatar_url)
+
+    @staticmethod
+    def _record_result(notification: DueNotification, *, success: bool) -> None:
+        birthday = notification.birthday
+        if not success:
+            retry_at = datetime.datetime.now(datetime.UTC) + RETRY_DELAY
+            if notification.early:
+                birthday.next_early_notify_at = retry_at
+            else:
+                birthday.next_notify_at = retry_at
+            return
+
+        year = get_now(birthday.user.timezone).year
+        if notification.early:
+            birthday.last_early_notify_year = year
+        else:
+            birthday.last_notify_year = year
+        birthday.schedule_notifications(birthday.user.timezone)
+
+    async def _notify_user(self, notifications: list[DueNotification], profiles: dict[int, DiscordProfile]) -> None:
+        """Send every due notification of a user in one roll-up message under the concurrency cap.
+
+        The caller saves the updated bookkeeping fields.
+        """
+        user = notifications[0].birthday.user
+        logger.info(f"Sending {len(notifications)} birthday notifications to {user.id}")
+
+        results: list[tuple[DueNotification, bool]] = []
+        async with self._semaphore:
+            for chunk in itertools.batched(notifications, MAX_EMBEDS_PER_MESSAGE):
+                embeds = [self._get_embed(item, profiles.get(item.birthday.bday_user_id)) for item in chunk]
+                lane = Lane.EARLY_BIRTHDAY if all(item.early for item in chunk) else Lane.BIRTHDAY
+                try:
+                    success = await self.bot.dm_user(user, embeds=embeds, lane=lane) is not None
+                except Exception:
+                    logger.exception(f"Failed to send birthday notifications to {user.id}")
+                    success = False
+                results.extend((item, success) for item in chunk)
+
+        # A success reschedules both notifications of its birthday, failures go last so their retry times stick
+        for notification, success in sorted(results, key=lambda result: not result[1]):
+            self._record_result(notification, success=success)
+
+    @staticmethod
+    def _get_due_notifications(birthday: Birthday, now: datetime.datetime) -> list[DueNotification]:
+        """Recompute the schedule of a due birthday, which moves it on if the notification day has already passed.
+
+        This catches notifications that became stale while the bot was down or after a failed send.
+        """
+        birthday.schedule_notifications(birthday.user.timezone)
+        return [
+            DueNotification(birthday, early=early)
+            for early, due_at in ((False, birthday.next_notify_at), (True, birthday.next_early_notify_at))
+            if due_at is not None and due_at <= now
+        ]
+
+    @tasks.loop(minutes=1)
     async def notify_birthdays(self) -> None:
-        timezones: list[int] = (
-            await LuminaUser.filter().distinct().values_list("timezone", flat=True)  # pyright: ignore[reportAssignmentType]
-        )
-
-        for timezone in timezones:
-            await self._process_regular_birthdays(timezone)
-            await self._process_early_notifications(timezone)
-
-    async def _process_regular_birthdays(self, timezone: int) -> None:
-        """Process and send regular birthday notifications for today."""
-        now = get_now(timezone)
-        is_leap_year = calendar.isleap(now.year)
-
-        birthdays = await Birthday.filter(
-            month=now.month, day=now.day, user__timezone=timezone, last_notify_year__lt=now.year
-        ).all()
-
+        """Send the due notifications grouped into one roll-up message per user, and save their bookkeeping at once."""
+        now = datetime.datetime.now(datetime.UTC)
+        birthdays = await Birthday.due(now).select_related("user")
+        if not birthdays:
+            return
+
+        start = time.perf_counter()
+        by_user: dict[int, list[DueNotification]] = {}
+        stale = 0
         for birthday in birthdays:
-            should_notify = self._check_leap_year_notification(birthday, now.month, now.day, is_leap_year=is_leap_year)
-            if should_notify:
-                await self._send_regular_notification(birthday)
-
-    async def _process_early_notifications(self, timezone: int) -> None:
-        """Process and send early birthday notifications (X days before birthday)."""
-        now = get_now(timezone)
+            notifications = self._get_due_notifications(birthday, now)
+            if not notifications:
+                stale += 1
+            by_user.setdefault(birthday.user_id, []).extend(notifications)
+        groups = [sorted(group, key=lambda item: item.early) for group in by_user.values() if group]
+
+        user_ids = {item.birthday.bday_user_id for group in groups for item in group if item.birthday.bday_user_id}
+        profiles = await get_profiles(self.bot, user_ids)
+        await asyncio.gather(*(self._notify_user(group, profiles) for group in groups))
+
+        async with in_transaction() as connection:
+            await Birthday.bulk_update(
+                birthdays,
+                fields=("last_notify_year", "last_early_notify_year", "next_notify_at", "next_early_notify_at"),
+                batch_size=500,
+                using_db=connection,
+            )
+        logger.info(
+            f"Sent {sum(len(group) for group in groups)} birthday notifications to {len(groups)} users "
+            f"in {time.perf_counter() - start:.2f}s, rescheduled {stale} stale ones"
+        )
 
-        birthdays = await Birthday.filter(
-            user__timezone=timezone, notify_days_before__isnull=False, last_early_notify_year__lt=now.year
-        ).all()
+    @tasks.loop(minutes=30)
+    async def refresh_profiles(self) -> None:
+        await refresh_upcoming_profiles(self.bot)
 
-        for birthday in birthdays:
-            if birthday.notify_days_before is None:
-                continue
-
-            target_date = self._calculate_target_birthday(birthday, now)
-            if target_date is None:
-                continue
-
-            early_notify_date = target_date - timedelta(days=birthday.notify_days_before)
-
-            if early_notify_date.date() == now.date():
-                await self._send_early_notification(birthday, birthday.notify_days_before)
-
-    def _check_leap_year_notification(
-        self, birthday: Birthday, now_month: int, now_day: int, *, is_leap_year: bool
-    ) -> bool:
-        """Check if a birthday notification should be sent, considering leap year edge cases."""
-        if (birthday.month, birthday.day) != (2, 29):
-            return True
-        if is_leap_year:
-            return True
-        return (birthday.leap_year_notify_month, birthday.leap_year_notify_day) == (now_month, now_day)
-
-    def _calculate_target_birthday(self, birthday: Birthday, now):  # noqa: ANN001, ANN202
-        """Calculate the target birthday date for the current or next year. Returns datetime or None."""
-        try:
-            target_date = now.replace(month=birthday.month, day=birthday.day)
-        except ValueError:
-            return None
-
-        if target_date < now:
-            try:
-                return target_date.replace(year=now.year + 1)
-            except ValueError:
-                return None
-
-        return target_date
+    @refresh_profiles.before_loop
+    async def before_refresh_profiles(self) -> None:
+        await self.bot.wait_until_ready()
 
     @notify_birthdays.before_loop
     async def before_run_reminders(self) -> None:
         await self.bot.wait_until_ready()
 
+        # Birthdays created before notification times were stored
+        await run_backfill(
+            "birthday_next_notify_at",
+            Birthday.filter(next_notify_at__isnull=True).select_related("user"),
+            lambda birthday: birthday.schedule_notifications(birthday.user.timezone),
+            fields=("next_notify_at", "next_early_notify_at"),
+        )
+
 
 async def setup(bot: Lumina) -> None:
     await bot.add_cog(ScheduleCog(bot))
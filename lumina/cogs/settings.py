@@ -7,7 +7,7 @@ from discord.ext import commands
 
 from lumina.exceptions import InvalidInputError
 from lumina.l10n import translator
-from lumina.models import LuminaUser, get_locale
+from lumina.models import Birthday, get_locale, get_lumina_user, user_cache
 
 if TYPE_CHECKING:
     from lumina.bot import Lumina
@@ -32,9 +32,10 @@ class SettingsCog(commands.Cog):
 
         await i.response.defer(ephemeral=True)
 
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        user = await get_lumina_user(i)
         user.lang = lang
         await user.save(update_fields=("lang",))
+        user_cache.set(user.id, user)
 
         embed = user.get_settings_saved_embed(await get_locale(i))
         await i.followup.send(embed=embed, ephemeral=True)
@@ -58,10 +59,11 @@ class SettingsCog(commands.Cog):
     async def set_timezone_command(self, i: Interaction, timezone: app_commands.Range[int, -12, 14]) -> None:
         await i.response.defer(ephemeral=True)
 
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        user = await get_lumina_user(i)
         user.timezone = timezone
         await user.save(update_fields=("timezone",))
-        await self.bot.scheduler.schedule_reminder()
+        user_cache.set(user.id, user)
+        await Birthday.reschedule_notifications(user.id, timezone=timezone)
 
         embed = user.get_settings_saved_embed(await get_locale(i))
         await i.followup.send(embed=embed, ephemeral=True)
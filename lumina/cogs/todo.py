@@ -9,8 +9,9 @@ from discord.ext import commands
 from lumina.components import Modal, Paginator, TextInput
 from lumina.exceptions import NoTasksError, TodoNotFoundError
 from lumina.l10n import LocaleStr, translator
-from lumina.models import LuminaUser, TodoTask, get_locale
+from lumina.models import TodoTask, get_locale, get_lumina_user
 from lumina.utils import shorten_text, split_list_to_chunks
+from lumina.write_queue import write_queue
 
 if TYPE_CHECKING:
     from lumina.bot import Lumina
@@ -44,9 +45,9 @@ class TodoCog(commands.GroupCog, name=app_commands.locale_str("todo", key="todo_
         await i.response.defer(ephemeral=True)
 
         locale = await get_locale(i)
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        todo = await TodoTask.create(
-            text=message.content or translator.translate(LocaleStr("no_content"), locale=locale), user=user
+        user = await get_lumina_user(i)
+        todo = await write_queue.create(
+            TodoTask, text=message.content or translator.translate(LocaleStr("no_content"), locale=locale), user=user
         )
         await i.followup.send(embed=todo.get_created_embed(locale), ephemeral=True)
 
@@ -59,8 +60,8 @@ class TodoCog(commands.GroupCog, name=app_commands.locale_str("todo", key="todo_
     async def todo_add_command(self, i: Interaction, text: str) -> None:
         await i.response.defer(ephemeral=True)
 
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        todo = await TodoTask.create(text=text, user=user)
+        user = await get_lumina_user(i)
+        todo = await write_queue.create(TodoTask, text=text, user=user)
         await i.followup.send(embed=todo.get_created_embed(await get_locale(i)), ephemeral=True)
 
     @app_commands.command(
@@ -70,7 +71,7 @@ class TodoCog(commands.GroupCog, name=app_commands.locale_str("todo", key="todo_
     @app_commands.rename(task_id=app_commands.locale_str("task", key="task_parameter_name"))
     @app_commands.describe(task_id=app_commands.locale_str("The task to mark as done", key="task_param_desc"))
     async def todo_done(self, i: Interaction, task_id: int) -> None:
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        user = await get_lumina_user(i)
         todo = await TodoTask.get_or_none(id=task_id, user=user)
         if todo is None:
             raise TodoNotFoundError
@@ -87,7 +88,7 @@ class TodoCog(commands.GroupCog, name=app_commands.locale_str("todo", key="todo_
     @app_commands.rename(task_id=app_commands.locale_str("task", key="task_parameter_name"))
     @app_commands.describe(task_id=app_commands.locale_str("The task to remove", key="task_remove_param_desc"))
     async def todo_remove(self, i: Interaction, task_id: int) -> None:
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        user = await get_lumina_user(i)
         todo = await TodoTask.get_or_none(id=task_id, user=user)
         if todo is None:
             raise TodoNotFoundError
@@ -97,8 +98,8 @@ class TodoCog(commands.GroupCog, name=app_commands.locale_str("todo", key="todo_
 
     @todo_done.autocomplete("task_id")
     async def task_done_task_id_autocomplete(self, i: Interaction, current: str) -> list[app_commands.Choice[int]]:
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        tasks = await TodoTask.filter(user=user, done=False).all()
+        user = await get_lumina_user(i)
+        tasks = await TodoTask.listed(user.id)
 
         if not tasks:
             return [
@@ -115,8 +116,8 @@ class TodoCog(commands.GroupCog, name=app_commands.locale_str("todo", key="todo_
 
     @todo_remove.autocomplete("task_id")
     async def task_id_autocomplete(self, i: Interaction, current: str) -> list[app_commands.Choice[int]]:
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
-        tasks = await TodoTask.filter(user=user).all()
+        user = await get_lumina_user(i)
+        tasks = await TodoTask.listed(user.id, include_done=True)
 
         if not tasks:
             return [
@@ -147,13 +148,13 @@ class TodoCog(commands.GroupCog, name=app_commands.locale_str("todo", key="todo_
     )
     async def todo_list(self, i: Interaction, show_done_tasks: int = 0) -> None:
         await i.response.defer(ephemeral=True)
-        user, _ = await LuminaUser.get_or_create(id=i.user.id)
+        user = await get_lumina_user(i)
         show_done_tasks = bool(show_done_tasks)
 
         if not show_done_tasks:
-            tasks = await TodoTask.filter(user=user, done=False).all()
+            tasks = await TodoTask.listed(user.id)
         else:
-            tasks = await TodoTask.filter(user=user).all()
+            tasks = await TodoTask.listed(user.id, include_done=True)
 
         if not tasks:
             raise NoTasksError
@@ -7,6 +7,7 @@ import discord
 from loguru import logger
 
 from lumina.error_handler import create_error_embed
+from lumina.models import get_user_context
 from lumina.utils import absolute_send
 
 if TYPE_CHECKING:
@@ -14,6 +15,11 @@ if TYPE_CHECKING:
 
 
 class CommandTree(discord.app_commands.CommandTree):
+    async def interaction_check(self, i: Interaction) -> bool:
+        # Resolve the user once here, commands read it from the interaction afterwards
+        await get_user_context(i)
+        return True
+
     async def on_error(self, i: Interaction, e: discord.app_commands.AppCommandError) -> None:
         error = e.original if isinstance(e, discord.app_commands.CommandInvokeError) else e
 
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar
 import discord
 from loguru import logger
 
+from lumina.dispatcher import Lane, dispatcher
 from lumina.exceptions import InvalidInputError
 from lumina.l10n import LocaleStr, translator
 from lumina.utils import absolute_send
@@ -46,7 +47,8 @@ class View(discord.ui.View):
             return
 
         self.disable_items()
-        await self.message.edit(view=self)
+        message = self.message
+        await dispatcher.run(Lane.EDIT, lambda: message.edit(view=self))
 
     def add_item(self, item: Button) -> Self:
         item.translate(self.locale)
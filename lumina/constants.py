@@ -1,5 +1,23 @@
 from __future__ import annotations
 
+from enum import StrEnum
+
 import discord
 
 DEFAULT_LOCALE = discord.Locale.american_english
+MAX_EMBEDS_PER_MESSAGE = 10
+"""Discord allows 10 embeds per message, larger digests and roll-ups are split into several messages."""
+
+
+class Role(StrEnum):
+    """What a Lumina process is responsible for."""
+
+    ALL = "all"
+    GATEWAY = "gateway"
+    """Handles interactions, reminders and birthdays are delivered by a separate scheduler process."""
+    SCHEDULER = "scheduler"
+    """Delivers reminders and birthdays over HTTP only, without connecting to the gateway."""
+
+
+DELIVERY_COGS = frozenset({"database", "retention", "schedule"})
+"""Cogs that deliver scheduled notifications or run background jobs, only loaded by processes in the scheduler role."""
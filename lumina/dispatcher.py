@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+DISPATCH_CONCURRENCY = int(os.getenv("DISPATCH_CONCURRENCY", "10"))
+"""How many outbound Discord requests of notifications can be in flight at the same time."""
+DISPATCH_QUEUE_SIZE = int(os.getenv("DISPATCH_QUEUE_SIZE", "1000"))
+"""How many requests each lane can hold waiting or in flight, callers wait for room once a lane is full."""
+
+
+class Lane(IntEnum):
+    """Priority of an outbound request, lower lanes are served first."""
+
+    REMINDER = 0
+    EDIT = 1
+    BIRTHDAY = 2
+    EARLY_BIRTHDAY = 3
+
+
+class LaneStats:
+    def __init__(self) -> None:
+        self.waiting = 0
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def __str__(self) -> str:
+        average = self.total_wait / self.requests if self.requests else 0
+        return (
+            f"{self.waiting} waiting, {self.requests} sent, "
+            f"wait avg={average * 1000:.0f}ms max={self.max_wait * 1000:.0f}ms"
+        )
+
+
+class Dispatcher:
+    """Gates the outbound Discord requests of notifications so urgent ones are never stuck behind a bulk send.
+
+    Requests run under a shared concurrency cap, a free slot goes to the lowest waiting lane, so a
+    reminder waits for at most one in-flight request no matter how many birthday notices are queued.
+    Each lane is bounded, callers of a full lane wait, which pushes back on the loops producing them.
+
+    Per-route and global rate limits are still handled by discord.py, which tracks buckets from the
+    response headers and sleeps inside the request, so a rate-limited request keeps its slot.
+    """
+
+    def __init__(self, *, concurrency: int, queue_size: int) -> None:
+        self.concurrency = concurrency
+        self.stats = {lane: LaneStats() for lane in Lane}
+
+        self._active = 0
+        self._waiters: list[tuple[Lane, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._lane_slots = {lane: asyncio.Semaphore(queue_size) for lane in Lane}
+
+    async def run[T](self, lane: Lane, request: Callable[[], Awaitable[T]]) -> T:
+        """Wait for a slot in the given lane, then make the request."""
+        stats = self.stats[lane]
+        start = time.perf_counter()
+        async with self._lane_slots[lane]:
+            stats.waiting += 1
+            try:
+                await self._acquire(lane)
+            finally:
+                stats.waiting -= 1
+
+            wait = time.perf_counter() - start
+            stats.requests += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            try:
+                return await request()
+            finally:
+                self._release()
+
+    def get_stats(self) -> str:
+        lanes = ", ".join(f"{lane.name.lower()}: {stats}" for lane, stats in self.stats.items())
+        return f"{self._active}/{self.concurrency} in flight; {lanes}"
+
+    async def _acquire(self, lane: Lane) -> None:
+        if self._active < self.concurrency and not self._waiters:
+            self._active += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (lane, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        # Hand the slot straight to the most urgent waiter, skipping ones that were cancelled
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+
+dispatcher = Dispatcher(concurrency=DISPATCH_CONCURRENCY, queue_size=DISPATCH_QUEUE_SIZE)
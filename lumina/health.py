@@ -10,14 +10,15 @@ if TYPE_CHECKING:
 
 
 class HealthCheckServer:
-    def __init__(self, bot: discord.Client) -> None:
+    def __init__(self, bot: discord.Client, *, port: int = 8080) -> None:
         self.bot = bot
+        self.port = port
         self.app = web.Application()
         self.runner: web.AppRunner | None = None
         self.site: web.TCPSite | None = None
 
     async def __aenter__(self) -> Self:
-        await self.start()
+        await self.start(port=self.port)
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import calendar
+import datetime
+import os
+from typing import TYPE_CHECKING, NamedTuple, Self
 
 import discord
 from tortoise import Model, fields
+from tortoise.expressions import Q
 
+from lumina.cache import TTLCache
 from lumina.embeds import DefaultEmbed
 from lumina.exceptions import InvalidBirthdayInputError
 from lumina.l10n import LocaleStr
-from lumina.utils import get_now, next_leap_year, shorten_text
+from lumina.utils import get_now, local_midnight, next_leap_year, shorten_text
 
 if TYPE_CHECKING:
-    import datetime
     from collections.abc import Sequence
 
+    from tortoise.queryset import QuerySet
+
     from lumina.types import Interaction, UserOrMember
 
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+"""How many users' settings are kept in memory."""
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "600"))
+"""How long, in seconds, cached settings are trusted, bounds staleness when several processes serve commands."""
+
 
 class BaseModel(Model):
     def __str__(self) -> str:
@@ -38,6 +49,8 @@ class LuminaUser(BaseModel):
     timezone = fields.SmallIntField(default=0)
     """The hour offset from UTC."""
     lang: fields.Field[str | None] = fields.CharField(max_length=5, null=True)
+    dm_channel_id: fields.Field[int | None] = fields.BigIntField(null=True)
+    """The DM channel with the user, stored after it is first opened so deliveries can post to it directly."""
 
     birthdays: fields.ReverseRelation[Birthday]
     reminders: fields.ReverseRelation[Reminder]
@@ -48,6 +61,20 @@ class LuminaUser(BaseModel):
     def locale(self) -> discord.Locale | None:
         return discord.Locale(self.lang) if self.lang else None
 
+    @classmethod
+    async def upsert(cls, user_id: int) -> LuminaUser:
+        """Get a user, creating it if it doesn't exist.
+
+        Existing users cost a single read, the insert ignores conflicts so concurrent first
+        interactions of a new user don't fail on each other.
+        """
+        user = await cls.get_or_none(id=user_id)
+        if user is not None:
+            return user
+
+        await cls.bulk_create([cls(id=user_id)], ignore_conflicts=True)
+        return await cls.get(id=user_id)
+
     @staticmethod
     def get_settings_saved_embed(locale: discord.Locale) -> DefaultEmbed:
         return DefaultEmbed(locale=locale, title=LocaleStr("settings_saved_embed_title"))
@@ -71,15 +98,22 @@ class Birthday(BaseModel):
     """How many days before the birthday to send an early notification (in addition to the day-of notification)."""
     last_early_notify_year = fields.IntField(default=0)
     """Track the year we last sent the early notification to avoid duplicates."""
+    next_notify_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True, db_index=True)
+    """When the next birthday notification is due in UTC, kept up to date by `schedule_notifications`."""
+    next_early_notify_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True, db_index=True)
+    """When the next early notification is due in UTC, None if early notifications are off."""
 
     @property
     def user_str(self) -> str:
         user_str = f"<@{self.bday_user_id}>" if self.bday_user_id != 0 else self.bday_username
         return "???" if user_str is None else user_str
 
-    def get_user_name(self, user: UserOrMember | None) -> str:
-        if user is None or self.bday_username is not None:
-            return self.bday_username or "???"
+    def get_user_name(self, user: UserOrMember | DiscordProfile | None) -> str:
+        if self.bday_username is not None:
+            return self.bday_username
+        if user is None:
+            # The user could not be fetched, the mention still renders their name for the reader
+            return self.user_str
         return f"{user.display_name} ({user.mention})"
 
     @staticmethod
@@ -99,6 +133,58 @@ class Birthday(BaseModel):
         except ValueError:
             return dt.replace(year=next_leap_year())
 
+    def get_notify_date(self, year: int) -> datetime.date | None:
+        """Get the date to send the birthday notification on in the given year, considering leap year settings."""
+        if (self.month, self.day) != (2, 29) or calendar.isleap(year):
+            return datetime.date(year, self.month, self.day)
+        if self.leap_year_notify_month is None or self.leap_year_notify_day is None:
+            return None
+        return datetime.date(year, self.leap_year_notify_month, self.leap_year_notify_day)
+
+    def get_early_notify_date(self, year: int) -> datetime.date | None:
+        """Get the date to send the early notification on for the birthday in the given year."""
+        if self.notify_days_before is None:
+            return None
+        try:
+            bday = datetime.date(year, self.month, self.day)
+        except ValueError:
+            return None
+        return bday - datetime.timedelta(days=self.notify_days_before)
+
+    def schedule_notifications(self, timezone: int) -> None:
+        """Compute `next_notify_at` and `next_early_notify_at` from today in the owner's timezone.
+
+        Notifications that were already sent this year are skipped using `last_notify_year` and
+        `last_early_notify_year`, so the next one falls on a later year. The caller saves the fields.
+        """
+        today = get_now(timezone).date()
+
+        self.next_notify_at = None
+        for year in range(max(today.year, self.last_notify_year + 1), today.year + 9):
+            date = self.get_notify_date(year)
+            if date is not None and date >= today:
+                self.next_notify_at = local_midnight(date, timezone)
+                break
+
+        self.next_early_notify_at = None
+        if self.notify_days_before is None:
+            return
+        # The early notification of a birthday early next year is sent this year
+        for year in range(today.year, today.year + 10):
+            date = self.get_early_notify_date(year)
+            if date is not None and date >= today and date.year > self.last_early_notify_year:
+                self.next_early_notify_at = local_midnight(date, timezone)
+                break
+
+    @classmethod
+    async def reschedule_notifications(cls, user_id: int, *, timezone: int) -> None:
+        """Recompute the notification times of all birthdays set by a user, e.g. after a timezone change."""
+        birthdays = await cls.filter(user_id=user_id)
+        for birthday in birthdays:
+            birthday.schedule_notifications(timezone)
+        if birthdays:
+            await cls.bulk_update(birthdays, fields=("next_notify_at", "next_early_notify_at"))
+
     def get_timestamp_md(self, timezone: int) -> str:
         """Get the timestamp in Discord-flavor markdown."""
         return discord.utils.format_dt(Birthday.get_correct_dt(month=self.month, day=self.day, timezone=timezone), "D")
@@ -148,17 +234,28 @@ class Birthday(BaseModel):
             description=LocaleStr("leap_year_notify_embed_description"),
         )
 
-    def get_embed(self, locale: discord.Locale, *, user: UserOrMember | None) -> DefaultEmbed:
-        return DefaultEmbed(
+    def get_embed(
+        self, locale: discord.Locale, *, user: UserOrMember | DiscordProfile | None, avatar_url: str | None = None
+    ) -> DefaultEmbed:
+        embed = DefaultEmbed(
             locale=locale,
             title=LocaleStr("birthday_embed_title"),
             description=LocaleStr("birthday_embed_description", params={"user": self.get_user_name(user)}),
         )
+        if avatar_url is not None:
+            embed.set_thumbnail(url=avatar_url)
+
+        return embed
 
     def get_early_notification_embed(
-        self, locale: discord.Locale, *, user: UserOrMember | None, days_before: int
+        self,
+        locale: discord.Locale,
+        *,
+        user: UserOrMember | DiscordProfile | None,
+        days_before: int,
+        avatar_url: str | None = None,
     ) -> DefaultEmbed:
-        return DefaultEmbed(
+        embed = DefaultEmbed(
             locale=locale,
             title=LocaleStr("birthday_early_notification_embed_title"),
             description=LocaleStr(
@@ -166,6 +263,10 @@ class Birthday(BaseModel):
                 params={"user": self.get_user_name(user), "days": str(days_before)},
             ),
         )
+        if avatar_url is not None:
+            embed.set_thumbnail(url=avatar_url)
+
+        return embed
 
     def get_display_embed(
         self, locale: discord.Locale, *, user: UserOrMember, timezone: int, avatar_url: str | None = None
@@ -197,7 +298,14 @@ class Birthday(BaseModel):
 
     @classmethod
     async def create_or_update(
-        cls, user_id: int, *, month: int, day: int, user: UserOrMember | None = None, name: str | None = None
+        cls,
+        user_id: int,
+        *,
+        month: int,
+        day: int,
+        timezone: int,
+        user: UserOrMember | None = None,
+        name: str | None = None,
     ) -> Birthday:
         if (user is None and name is None) or (user is not None and name is not None):
             raise InvalidBirthdayInputError
@@ -206,15 +314,43 @@ class Birthday(BaseModel):
         if bday is not None:
             bday.month = month
             bday.day = day
-            await bday.save(update_fields=("month", "day"))
+            bday.schedule_notifications(timezone)
+            await bday.save(update_fields=("month", "day", "next_notify_at", "next_early_notify_at"))
             return bday
 
-        return await super().create(
+        bday = cls(
             user_id=user_id, bday_user_id=user.id if user is not None else 0, bday_username=name, month=month, day=day
         )
+        bday.schedule_notifications(timezone)
+        await bday.save()
+        return bday
+
+    @classmethod
+    def owned_by(cls, user_id: int) -> QuerySet[Self]:
+        """Birthdays the user added."""
+        return cls.filter(user_id=user_id)
+
+    @classmethod
+    def due(cls, until: datetime.datetime) -> QuerySet[Self]:
+        """Birthdays with a notification or early notification due at or before the given time."""
+        return cls.filter(Q(next_notify_at__lte=until) | Q(next_early_notify_at__lte=until))
 
     class Meta:
         unique_together = ("bday_user_id", "user", "bday_username")
+        indexes = (("user",),)
+
+
+class DiscordProfile(BaseModel):
+    """The parts of a Discord user needed to render birthdays, so notifications don't have to fetch the user."""
+
+    id = fields.BigIntField(pk=True, generated=False)
+    display_name = fields.CharField(max_length=100)
+    avatar_url = fields.TextField()
+    fetched_at = fields.DatetimeField(db_index=True)
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
 
 
 class Reminder(BaseModel):
@@ -227,6 +363,67 @@ class Reminder(BaseModel):
     created_at = fields.DatetimeField(auto_now_add=True)
     message_url: fields.Field[str | None] = fields.TextField(null=True)
     sent = fields.BooleanField(default=False)
+    """Whether the reminder is done, either delivered or given up on after all attempts failed.
+
+    Done reminders are kept until retention purges them, delivered ones so they can still be snoozed.
+    """
+    delivered_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+    """When the reminder was delivered in UTC, None if it is pending or was dead-lettered."""
+    attempts = fields.SmallIntField(default=0)
+    """How many delivery attempts have failed."""
+    next_attempt_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+    """When to retry a failed delivery in UTC, None if delivery has not been attempted yet."""
+    last_error: fields.Field[str | None] = fields.TextField(null=True)
+    claimed_by: fields.Field[str | None] = fields.CharField(max_length=100, null=True)
+    """The claim token of the scheduler worker that is delivering the reminder."""
+    lease_until: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+    """Until when the claim is valid in UTC, expired claims can be taken over by other workers."""
+
+    class Meta:
+        indexes = (("sent", "datetime"), ("sent", "next_attempt_at"), ("user", "datetime"), ("claimed_by",))
+
+    @property
+    def due_at(self) -> datetime.datetime:
+        """When the next delivery attempt should be made."""
+        return self.next_attempt_at or self.datetime
+
+    @staticmethod
+    def due_by(dt: datetime.datetime) -> Q:
+        """Filter for reminders whose next delivery attempt is due at or before the given time."""
+        return Q(datetime__lte=dt, next_attempt_at__isnull=True) | Q(next_attempt_at__lte=dt)
+
+    @staticmethod
+    def unclaimed(now: datetime.datetime) -> Q:
+        """Filter for reminders that no scheduler worker holds a valid lease on."""
+        return Q(lease_until__isnull=True) | Q(lease_until__lt=now)
+
+    @classmethod
+    def pending(cls, user_id: int) -> QuerySet[Self]:
+        """The user's reminders that were not delivered yet, soonest first."""
+        return cls.filter(user_id=user_id, sent=False).order_by("datetime")
+
+    @classmethod
+    def due_unclaimed(cls, until: datetime.datetime, now: datetime.datetime) -> QuerySet[Self]:
+        """Undelivered reminders due by `until` that no worker holds a valid lease on."""
+        return cls.filter(cls.due_by(until), cls.unclaimed(now), sent=False)
+
+    @classmethod
+    def overdue_after(cls, cutoff: datetime.datetime, last: tuple[datetime.datetime, int] | None) -> QuerySet[Self]:
+        """Undelivered reminders due by the cutoff, oldest first, after the `(datetime, id)` keyset `last`."""
+        query = cls.filter(cls.due_by(cutoff), sent=False)
+        if last is not None:
+            query = query.filter(Q(datetime__gt=last[0]) | Q(datetime=last[0], id__gt=last[1]))
+        return query.order_by("datetime", "id")
+
+    @classmethod
+    def claimed(cls, token: str) -> QuerySet[Self]:
+        """Reminders claimed with the given token, oldest first."""
+        return cls.filter(claimed_by=token).order_by("datetime", "id")
+
+    @classmethod
+    def purgeable(cls, cutoff: datetime.datetime) -> QuerySet[Self]:
+        """Delivered and dead-lettered reminders that were due before the cutoff."""
+        return cls.filter(sent=True, datetime__lt=cutoff)
 
     def get_embed(self, locale: discord.Locale) -> DefaultEmbed:
         if self.message_url is not None:
@@ -270,13 +467,31 @@ class TodoTask(BaseModel):
     user = fields.ForeignKeyField("models.LuminaUser", related_name="todos")
     created_at = fields.DatetimeField(auto_now_add=True)
     done = fields.BooleanField(default=False)
+    done_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+    """When the task was marked as done, None for tasks done before this was tracked."""
 
     async def mark_done(self) -> None:
         self.done = True
-        await self.save(update_fields=("done",))
+        self.done_at = datetime.datetime.now(datetime.UTC)
+        await self.save(update_fields=("done", "done_at"))
+
+    @classmethod
+    def listed(cls, user_id: int, *, include_done: bool = False) -> QuerySet[Self]:
+        """The user's tasks, newest first, only the ones not done unless `include_done`."""
+        query = cls.filter(user_id=user_id)
+        return query if include_done else query.filter(done=False)
+
+    @classmethod
+    def archivable(cls, cutoff: datetime.datetime) -> QuerySet[Self]:
+        """Tasks that were done before the cutoff, oldest first."""
+        # Tasks done before done_at was tracked fall back to their creation time
+        return cls.filter(Q(done_at__lt=cutoff) | Q(done_at__isnull=True, created_at__lt=cutoff), done=True).order_by(
+            "id"
+        )
 
     class Meta:
         ordering = ["-created_at"]  # noqa: RUF012
+        indexes = (("user", "done", "created_at"), ("done", "done_at"))
 
     def get_created_embed(self, locale: discord.Locale) -> DefaultEmbed:
         return DefaultEmbed(
@@ -317,6 +532,18 @@ class TodoTask(BaseModel):
         )
 
 
+class TodoArchive(BaseModel):
+    """Done tasks moved out of `TodoTask` by the retention job, kept compact and off the hot table."""
+
+    id = fields.IntField(pk=True, generated=False)
+    """The ID the task had in `TodoTask`."""
+    user_id = fields.BigIntField(db_index=True)
+    text = fields.TextField()
+    created_at = fields.DatetimeField()
+    done_at: fields.Field[datetime.datetime | None] = fields.DatetimeField(null=True)
+    archived_at = fields.DatetimeField(auto_now_add=True)
+
+
 class Notes(BaseModel):
     id = fields.IntField(pk=True, generated=True)
     title = fields.CharField(max_length=100)
@@ -350,11 +577,54 @@ class Notes(BaseModel):
         )
 
 
+class BackfillCheckpoint(BaseModel):
+    name = fields.CharField(max_length=100, pk=True)
+    """The name of the backfill, see `lumina.backfill.run_backfill`."""
+    last_id = fields.BigIntField(default=0)
+    """The highest primary key processed so far, the backfill resumes after it."""
+    processed = fields.BigIntField(default=0)
+    done = fields.BooleanField(default=False)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+
+user_cache: TTLCache[int, LuminaUser] = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+"""Settings of recently active users, written through by the settings commands."""
+
+
+class UserContext(NamedTuple):
+    """The Lumina user behind an interaction, resolved once and shared by everything handling the interaction."""
+
+    user: LuminaUser
+    interaction_locale: discord.Locale
+
+    @property
+    def locale(self) -> discord.Locale:
+        return self.user.locale or self.interaction_locale
+
+    @property
+    def timezone(self) -> int:
+        return self.user.timezone
+
+
+async def get_user_context(i: Interaction) -> UserContext:
+    context: UserContext | None = i.extras.get("user_context")
+    if context is None:
+        user = user_cache.get(i.user.id)
+        if user is None:
+            user = await LuminaUser.upsert(i.user.id)
+            user_cache.set(user.id, user)
+        context = UserContext(user, i.locale)
+        i.extras["user_context"] = context
+    return context
+
+
+async def get_lumina_user(i: Interaction) -> LuminaUser:
+    return (await get_user_context(i)).user
+
+
 async def get_locale(i: Interaction) -> discord.Locale:
-    user, _ = await LuminaUser.get_or_create(id=i.user.id)
-    return user.locale or i.locale
+    return (await get_user_context(i)).locale
 
 
-async def get_timezone(user_id: int) -> int:
-    user, _ = await LuminaUser.get_or_create(id=user_id)
-    return user.timezone
+async def get_timezone(i: Interaction) -> int:
+    return (await get_user_context(i)).timezone
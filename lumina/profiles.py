@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import os
+from typing import TYPE_CHECKING
+
+import discord
+from loguru import logger
+
+from lumina.models import Birthday, DiscordProfile
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from lumina.bot import Lumina
+
+PROFILE_TTL = datetime.timedelta(hours=int(os.getenv("PROFILE_CACHE_TTL_HOURS", "24")))
+"""How long a cached Discord profile is used before it is fetched again."""
+PROFILE_REFRESH_AHEAD = datetime.timedelta(days=2)
+"""Profiles of users whose birthday notifications are due within this window are kept fresh."""
+PROFILE_FETCH_INTERVAL = 0.5
+"""How long, in seconds, to wait between two user fetches of a background refresh."""
+
+
+async def fetch_profiles(bot: Lumina, user_ids: Collection[int], *, interval: float = 0) -> list[DiscordProfile]:
+    """Fetch Discord users and store their profiles.
+
+    Users that no longer exist or could not be fetched are skipped, callers keep their stale profile if
+    they have one, so a failing request never stops a notification pass.
+    """
+    now = datetime.datetime.now(datetime.UTC)
+    profiles: list[DiscordProfile] = []
+    for user_id in user_ids:
+        try:
+            user = bot.get_user(user_id) or await bot.fetch_user(user_id)
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to fetch the Discord profile of {user_id}: {e}")
+        else:
+            profiles.append(
+                DiscordProfile(
+                    id=user.id, display_name=user.display_name, avatar_url=user.display_avatar.url, fetched_at=now
+                )
+            )
+        await asyncio.sleep(interval)
+
+    if profiles:
+        await DiscordProfile.bulk_create(
+            profiles, on_conflict=("id",), update_fields=("display_name", "avatar_url", "fetched_at")
+        )
+    return profiles
+
+
+async def get_profiles(bot: Lumina, user_ids: Collection[int]) -> dict[int, DiscordProfile]:
+    """Get the cached profiles of Discord users, fetching only the ones that were never cached.
+
+    Stale profiles are still returned, `refresh_upcoming_profiles` refreshes them ahead of time.
+    """
+    profiles = {profile.id: profile for profile in await DiscordProfile.filter(id__in=user_ids)}
+    missing = [user_id for user_id in user_ids if user_id not in profiles]
+    if missing:
+        profiles.update((profile.id, profile) for profile in await fetch_profiles(bot, missing))
+    return profiles
+
+
+async def refresh_upcoming_profiles(bot: Lumina) -> None:
+    """Fetch the profiles that upcoming birthday notifications need and are missing or stale, at a gentle pace."""
+    now = datetime.datetime.now(datetime.UTC)
+    upcoming = now + PROFILE_REFRESH_AHEAD
+    birthdays = await Birthday.due(upcoming).filter(bday_user_id__not=0).only("id", "bday_user_id")
+    user_ids = {birthday.bday_user_id for birthday in birthdays}
+    if not user_ids:
+        return
+
+    fresh = await DiscordProfile.filter(id__in=user_ids, fetched_at__gte=now - PROFILE_TTL).values_list("id", flat=True)
+    stale = user_ids - set(fresh)
+    if stale:
+        profiles = await fetch_profiles(bot, stale, interval=PROFILE_FETCH_INTERVAL)
+        logger.info(f"Refreshed {len(profiles)} of {len(stale)} Discord profiles for upcoming birthdays")
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import os
+import time
+
+from loguru import logger
+from tortoise import connections
+from tortoise.transactions import in_transaction
+
+from lumina.models import Reminder, TodoArchive, TodoTask
+
+TODO_ARCHIVE_AFTER = datetime.timedelta(days=int(os.getenv("TODO_ARCHIVE_DAYS", "30")))
+"""How long done tasks stay in the todo list before they are archived."""
+DONE_REMINDER_RETENTION = datetime.timedelta(days=int(os.getenv("DEAD_REMINDER_RETENTION_DAYS", "7")))
+"""How long done reminders are kept after they were due, delivered ones can be snoozed by custom ID until then."""
+RETENTION_BATCH_SIZE = 500
+"""How many rows are moved or deleted per transaction."""
+RETENTION_PAUSE = 0.1
+"""How long, in seconds, to sleep between batches so other writers can take the database lock."""
+VACUUM_STEP_PAGES = 1000
+"""How many free pages an incremental vacuum returns to the file system per run."""
+AUTO_VACUUM_INCREMENTAL = 2
+VACUUM_FREE_RATIO = 0.25
+"""Suggest the vacuum owner command once this share of a file without incremental vacuum is free pages."""
+
+
+async def archive_done_todos(cutoff: datetime.datetime) -> int:
+    """Move tasks that were done before the cutoff into `TodoArchive`, returns how many were moved."""
+    archived = 0
+    while (
+        todos := await TodoTask.archivable(cutoff)
+        .limit(RETENTION_BATCH_SIZE)
+        .values("id", "user_id", "text", "created_at", "done_at")
+    ):
+        async with in_transaction() as db:
+            await TodoArchive.bulk_create([TodoArchive(**todo) for todo in todos], using_db=db, ignore_conflicts=True)
+            await TodoTask.filter(id__in=[todo["id"] for todo in todos]).using_db(db).delete()
+        archived += len(todos)
+        await asyncio.sleep(RETENTION_PAUSE)
+    return archived
+
+
+async def purge_done_reminders(cutoff: datetime.datetime) -> int:
+    """Delete delivered and dead-lettered reminders that were due before the cutoff, returns how many were deleted."""
+    purged = 0
+    while ids := await Reminder.purgeable(cutoff).limit(RETENTION_BATCH_SIZE).values_list("id", flat=True):
+        purged += await Reminder.filter(id__in=ids).delete()
+        await asyncio.sleep(RETENTION_PAUSE)
+    return purged
+
+
+async def compact_sqlite() -> None:
+    """Return free pages to the file system once the database is in incremental auto-vacuum mode.
+
+    A full VACUUM blocks every writer for as long as it takes, so it is never run from here, see `vacuum_sqlite`.
+    """
+    db = connections.get("default")
+    _, rows = await db.execute_query("PRAGMA freelist_count")
+    free_pages: int = rows[0][0]
+    if not free_pages:
+        return
+
+    _, rows = await db.execute_query("PRAGMA auto_vacuum")
+    _, page_rows = await db.execute_query("PRAGMA page_count")
+    page_count: int = page_rows[0][0]
+    if rows[0][0] != AUTO_VACUUM_INCREMENTAL:
+        if free_pages > page_count * VACUUM_FREE_RATIO:
+            logger.info(
+                f"{free_pages} of {page_count} pages are free but incremental vacuum is not enabled yet, "
+                "run the vacuum owner command once to enable it"
+            )
+        return
+
+    start = time.perf_counter()
+    await db.execute_script(f"PRAGMA incremental_vacuum({VACUUM_STEP_PAGES})")
+    _, rows = await db.execute_query("PRAGMA freelist_count")
+    logger.info(
+        f"Incremental vacuum freed {free_pages - rows[0][0]} of {page_count} pages "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+
+async def vacuum_sqlite() -> int:
+    """Rebuild the database file with a full VACUUM, returns how many pages were freed.
+
+    Writers wait until it finishes and it needs as much free disk as the database takes, so it only runs on
+    demand. It also switches the file to incremental auto-vacuum, which `compact_sqlite` relies on.
+    """
+    db = connections.get("default")
+    _, rows = await db.execute_query("PRAGMA page_count")
+    page_count: int = rows[0][0]
+
+    start = time.perf_counter()
+    # auto_vacuum=INCREMENTAL is set on every connection but only takes effect after a VACUUM
+    await db.execute_script("VACUUM")
+    _, rows = await db.execute_query("PRAGMA page_count")
+    freed = page_count - rows[0][0]
+    logger.info(f"VACUUM freed {freed} of {page_count} pages in {time.perf_counter() - start:.2f}s")
+    return freed
+
+
+async def run_retention(*, sqlite: bool) -> None:
+    now = datetime.datetime.now(datetime.UTC)
+    archived = await archive_done_todos(now - TODO_ARCHIVE_AFTER)
+    purged = await purge_done_reminders(now - DONE_REMINDER_RETENTION)
+    if archived or purged:
+        logger.info(f"Retention archived {archived} done tasks and purged {purged} done reminders")
+    if sqlite:
+        await compact_sqlite()
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+import heapq
+import itertools
+import os
+import socket
+import time
+import uuid
+from typing import TYPE_CHECKING, NamedTuple
+
+import discord
+from loguru import logger
+
+from lumina.cogs.reminder import DigestSnoozeSelect, SnoozeView
+from lumina.constants import DEFAULT_LOCALE, MAX_EMBEDS_PER_MESSAGE
+from lumina.dispatcher import Lane
+from lumina.models import Reminder
+from lumina.write_queue import write_queue
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
+    from lumina.bot import Lumina
+    from lumina.embeds import DefaultEmbed
+
+REMINDER_CONCURRENCY = int(os.getenv("REMINDER_CONCURRENCY", "10"))
+"""How many reminders can be delivered at the same time."""
+FETCH_CHUNK_SIZE = 500
+"""Maximum number of reminder IDs in a single query, keeps the query under SQLite's variable limit."""
+LOOKAHEAD = datetime.timedelta(minutes=2)
+"""How far ahead reminders are hydrated before they are due."""
+PREFETCH_INTERVAL = float(os.getenv("REMINDER_POLL_INTERVAL", "30"))
+"""How often, in seconds, the lookahead window is refreshed and reminders created by other processes are picked up."""
+MAX_DELIVERY_ATTEMPTS = int(os.getenv("REMINDER_MAX_ATTEMPTS", "5"))
+"""How many times delivering a reminder is attempted before it is dead-lettered."""
+RETRY_BASE_DELAY = datetime.timedelta(minutes=1)
+"""The delay before the first retry, doubled after every failed attempt."""
+CATCHUP_RATE = float(os.getenv("REMINDER_CATCHUP_RATE", "5"))
+"""How many overdue reminders are delivered per second while catching up after downtime."""
+CATCHUP_CHUNK_SIZE = 100
+"""How many overdue reminders are loaded at a time while catching up."""
+DIGEST_WINDOW = min(float(os.getenv("REMINDER_DIGEST_WINDOW", "0")), LOOKAHEAD.total_seconds())
+"""How far apart, in seconds, reminders of a user can be due and still be delivered in one message, 0 to disable.
+
+Capped at the lookahead window, only prepared reminders can join a digest early.
+"""
+LEASE_DURATION = datetime.timedelta(minutes=1)
+"""How long a worker's claim on a batch of reminders lasts before other workers can take it over."""
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+"""Identifies this process in reminder claims."""
+
+
+class PreparedReminder(NamedTuple):
+    """A reminder with everything needed to deliver it, so only the send call is left at due time."""
+
+    reminder: Reminder
+    channel: discord.abc.Messageable | None
+    embed: DefaultEmbed
+    view: SnoozeView
+
+
+class ReminderScheduler:
+    """Keeps an in-memory min-heap of upcoming reminders and fires them when they are due.
+
+    The heap is loaded once from the database on startup and then kept up to date through
+    `add_reminder` and `remove_reminder`, so scheduling a reminder does not touch the database.
+    Removed entries are discarded lazily when they reach the top of the heap.
+
+    Reminders that fall due within the lookahead window are hydrated ahead of time: their rows,
+    locale, DM channel, embed and view are prepared so that firing them is a single send call.
+    The lookahead query also picks up reminders created by other processes.
+
+    Several processes can share the reminder table. Before delivering, a worker claims the
+    reminders with a short lease, reminders claimed by another worker are skipped, and
+    reminders whose lease expired because their worker died are taken over.
+
+    With `REMINDER_DIGEST_WINDOW` set, reminders of the same user that are due together, or within
+    the window of one that is due, are delivered as one digest message instead of one message each.
+    """
+
+    def __init__(self, bot: Lumina) -> None:
+        self.bot = bot
+        self.current_task: asyncio.Task | None = None
+        self.prefetch_task: asyncio.Task | None = None
+        self.catchup_task: asyncio.Task | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        """Batches that are still being delivered, the loop keeps firing due reminders meanwhile."""
+        self._backlog_cutoff: datetime.datetime | None = None
+        """Reminders due before this time are left to the catch-up task."""
+
+        self._heap: list[tuple[float, int]] = []
+        self._due: dict[int, float] = {}
+        """Maps reminder IDs to their due timestamps, used to detect stale heap entries."""
+        self._prepared: dict[int, PreparedReminder] = {}
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(REMINDER_CONCURRENCY)
+
+    async def prepare_reminder(self, reminder: Reminder) -> PreparedReminder:
+        """Resolve the locale and DM channel of a reminder and render its message."""
+        locale = reminder.user.locale or DEFAULT_LOCALE
+        async with self._semaphore:
+            channel = await self.bot.open_dm(reminder.user, lane=Lane.REMINDER)
+
+        return PreparedReminder(
+            reminder=reminder,
+            channel=channel,
+            embed=reminder.get_embed(locale),
+            view=SnoozeView(reminder, locale=locale),
+        )
+
+    async def send_reminder(self, prepared: PreparedReminder) -> None:
+        reminder = prepared.reminder
+        logger.info(f"Sending reminder to {reminder.user_id}")
+
+        if prepared.channel is None:
+            await self._record_failure(reminder, "Could not open a DM channel")
+            return
+
+        try:
+            message = await self.bot.send_dm(
+                reminder.user, prepared.channel, embeds=(prepared.embed,), lane=Lane.REMINDER, view=prepared.view
+            )
+        except discord.HTTPException as e:
+            await self._record_failure(reminder, f"{e.status} {e.text}")
+            return
+
+        prepared.view.message = message
+        await self._mark_delivered(reminder)
+
+    async def send_digest(self, group: Sequence[PreparedReminder]) -> None:
+        """Deliver several reminders of the same user in one message, with a select to snooze any of them."""
+        reminders = [item.reminder for item in group]
+        user = reminders[0].user
+        logger.info(f"Sending a digest of {len(reminders)} reminders to {user.id}")
+
+        channel = group[0].channel
+        if channel is None:
+            for reminder in reminders:
+                await self._record_failure(reminder, "Could not open a DM channel")
+            return
+
+        view = discord.ui.View(timeout=None)
+        view.add_item(DigestSnoozeSelect.build(reminders, locale=user.locale or DEFAULT_LOCALE))
+        try:
+            await self.bot.send_dm(user, channel, embeds=[item.embed for item in group], lane=Lane.REMINDER, view=view)
+        except discord.HTTPException as e:
+            for reminder in reminders:
+                await self._record_failure(reminder, f"{e.status} {e.text}")
+            return
+
+        await asyncio.gather(*(self._mark_delivered(reminder) for reminder in reminders))
+
+    @staticmethod
+    async def _mark_delivered(reminder: Reminder) -> None:
+        """Mark a reminder done, its row is kept so snooze buttons handled by custom ID can read its full text."""
+        reminder.sent = True
+        reminder.delivered_at = datetime.datetime.now(datetime.UTC)
+        reminder.claimed_by = None
+        reminder.lease_until = None
+        await write_queue.save(reminder, update_fields=("sent", "delivered_at", "claimed_by", "lease_until"))
+
+    async def _record_failure(self, reminder: Reminder, error: str) -> None:
+        """Schedule a retry with exponential backoff, or dead-letter the reminder if it ran out of attempts."""
+        reminder.attempts += 1
+        reminder.last_error = error
+
+        if reminder.attempts >= MAX_DELIVERY_ATTEMPTS:
+            logger.warning(f"Giving up on reminder {reminder.id} after {reminder.attempts} attempts: {error}")
+            reminder.sent = True
+        else:
+            delay = RETRY_BASE_DELAY * 2 ** (reminder.attempts - 1)
+            logger.warning(f"Failed to deliver reminder {reminder.id}, retrying in {delay}: {error}")
+            reminder.next_attempt_at = datetime.datetime.now(datetime.UTC) + delay
+            self.add_reminder(reminder)
+
+        reminder.claimed_by = None
+        reminder.lease_until = None
+        await write_queue.save(
+            reminder, update_fields=("attempts", "last_error", "sent", "next_attempt_at", "claimed_by", "lease_until")
+        )
+
+    async def _claim(self, reminder_ids: Iterable[int], *, due_by: datetime.datetime | None = None) -> str:
+        """Lease the given reminders that are due by `due_by`, now by default, and not claimed by another worker.
+
+        Reminders whose retry was backed off since they were scheduled are left alone until their next attempt.
+
+        Returns:
+            The claim token, reminders claimed by this call have `claimed_by` set to it.
+        """
+        token = f"{WORKER_ID}:{uuid.uuid4().hex[:8]}"
+        now = datetime.datetime.now(datetime.UTC)
+        for chunk in itertools.batched(reminder_ids, FETCH_CHUNK_SIZE):
+            await (
+                Reminder.due_unclaimed(due_by or now, now)
+                .filter(id__in=chunk)
+                .update(claimed_by=token, lease_until=now + LEASE_DURATION)
+            )
+        return token
+
+    async def _renew_lease(self, token: str) -> None:
+        lease_until = datetime.datetime.now(datetime.UTC) + LEASE_DURATION
+        await Reminder.filter(claimed_by=token).update(lease_until=lease_until)
+
+    @contextlib.asynccontextmanager
+    async def _hold_lease(self, token: str) -> AsyncIterator[None]:
+        """Keep renewing a claim until the block exits, so its reminders can't be taken over while they are queued."""
+
+        async def renew() -> None:
+            while True:
+                await asyncio.sleep(LEASE_DURATION.total_seconds() / 2)
+                try:
+                    await self._renew_lease(token)
+                except Exception:
+                    logger.exception(f"Failed to renew the lease of claim {token}")
+
+        task = asyncio.create_task(renew())
+        try:
+            yield
+        finally:
+            task.cancel()
+
+    async def release_leases(self) -> None:
+        """Release every lease held by this process so other workers can take the reminders over."""
+        await Reminder.filter(claimed_by__startswith=f"{WORKER_ID}:").update(claimed_by=None, lease_until=None)
+
+    async def load(self) -> None:
+        """Load all unsent reminders into the heap and start the scheduler tasks.
+
+        Reminders that became overdue while the bot was offline are left out of the heap and
+        delivered by a rate-limited catch-up task instead, so they don't delay live reminders.
+        """
+        cutoff = datetime.datetime.now(datetime.UTC)
+        rows: list[tuple[int, datetime.datetime, datetime.datetime | None]] = await Reminder.filter(
+            sent=False
+        ).values_list("id", "datetime", "next_attempt_at")  # pyright: ignore[reportAssignmentType]
+
+        self._due = {}
+        backlog = 0
+        for reminder_id, dt, next_attempt_at in rows:
+            due_at = next_attempt_at or dt
+            if due_at <= cutoff:
+                backlog += 1
+            else:
+                self._due[reminder_id] = due_at.timestamp()
+
+        self._heap = [(due, reminder_id) for reminder_id, due in self._due.items()]
+        heapq.heapify(self._heap)
+        logger.info(f"Loaded {len(self._heap)} reminders into the scheduler, {backlog} are overdue")
+
+        self.cancel_task()
+        self.current_task = asyncio.create_task(self._run())
+        self.prefetch_task = asyncio.create_task(self._prefetch_loop())
+        if backlog:
+            self._backlog_cutoff = cutoff
+            self.catchup_task = asyncio.create_task(self._catch_up(cutoff, total=backlog))
+
+    async def _catch_up(self, cutoff: datetime.datetime, *, total: int) -> None:
+        """Deliver reminders that were due before `cutoff`, oldest first, at a capped rate."""
+        started_at = time.monotonic()
+        delivered = 0
+        last: tuple[datetime.datetime, int] | None = None
+
+        while True:
+            chunk: list[Reminder] = await Reminder.overdue_after(cutoff, last).limit(CATCHUP_CHUNK_SIZE)
+            if not chunk:
+                break
+            last = chunk[-1].datetime, chunk[-1].id
+
+            token = await self._claim((reminder.id for reminder in chunk), due_by=cutoff)
+            claimed = await Reminder.claimed(token).prefetch_related("user")
+
+            tasks: list[asyncio.Task] = []
+            async with self._hold_lease(token):
+                for reminder in claimed:
+                    tasks.append(asyncio.create_task(self._catch_up_one(reminder)))
+                    await asyncio.sleep(1 / CATCHUP_RATE)
+                await asyncio.gather(*tasks)
+
+            delivered += len(claimed)
+            elapsed = time.monotonic() - started_at
+            logger.info(f"Caught up on {delivered}/{total} overdue reminders ({delivered / elapsed:.1f}/s)")
+
+        self._backlog_cutoff = None
+        logger.info(f"Finished catching up on {delivered} overdue reminders in {time.monotonic() - started_at:.1f}s")
+
+    async def _catch_up_one(self, reminder: Reminder) -> None:
+        try:
+            prepared = await self.prepare_reminder(reminder)
+        except Exception:
+            logger.exception(f"Failed to prepare reminder {reminder.id}")
+            return
+        await self._deliver((prepared,))
+
+    def add_reminder(self, reminder: Reminder) -> None:
+        """Schedule a newly created reminder.
+
+        Does nothing if the scheduler is not running, e.g. in the gateway role where another process
+        delivers reminders and picks new ones up from the database.
+        """
+        if self.current_task is None:
+            return
+
+        due = reminder.due_at.timestamp()
+        self._due[reminder.id] = due
+        heapq.heappush(self._heap, (due, reminder.id))
+
+        if self._heap[0] == (due, reminder.id):
+            # The new reminder is the earliest one, the sleeping task needs to wake up earlier
+            self._wakeup.set()
+
+    def remove_reminder(self, reminder_id: int) -> None:
+        """Unschedule a reminder, its heap entry is discarded when it reaches the top."""
+        self._due.pop(reminder_id, None)
+        self._prepared.pop(reminder_id, None)
+
+    def _peek(self) -> tuple[float, int] | None:
+        while self._heap:
+            due, reminder_id = self._heap[0]
+            if self._due.get(reminder_id) == due:
+                return due, reminder_id
+            heapq.heappop(self._heap)
+        return None
+
+    def _pop_due(self, now: float) -> dict[int, float]:
+        """Pop every reminder that is due at or before `now` from the heap."""
+        due_reminders: dict[int, float] = {}
+        while (entry := self._peek()) is not None and entry[0] <= now:
+            due, reminder_id = heapq.heappop(self._heap)
+            del self._due[reminder_id]
+            due_reminders[reminder_id] = due
+        return due_reminders
+
+    def _pop_digest_companions(self, due_reminders: dict[int, float], until: float) -> dict[int, float]:
+        """Pop the prepared reminders due by `until` of users who have a reminder in `due_reminders`.
+
+        They are delivered early, in the same digest as the reminder that is due.
+        """
+        user_ids = {self._prepared[rid].reminder.user_id for rid in due_reminders if rid in self._prepared}
+        companions: dict[int, float] = {}
+        for reminder_id, item in self._prepared.items():
+            due = self._due.get(reminder_id)
+            if due is not None and due <= until and item.reminder.user_id in user_ids:
+                companions[reminder_id] = due
+
+        for reminder_id in companions:
+            del self._due[reminder_id]
+        return companions
+
+    @staticmethod
+    def _group_digests(prepared: Iterable[PreparedReminder]) -> list[Sequence[PreparedReminder]]:
+        by_user: dict[int, list[PreparedReminder]] = {}
+        for item in sorted(prepared, key=lambda item: item.reminder.due_at):
+            by_user.setdefault(item.reminder.user_id, []).append(item)
+        return [batch for items in by_user.values() for batch in itertools.batched(items, MAX_EMBEDS_PER_MESSAGE)]
+
+    async def _prefetch(self) -> None:
+        """Hydrate the reminders that fall due within the lookahead window.
+
+        Reminders that are not in the heap yet were created by other processes or released by
+        another worker, they are scheduled here.
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        reminders = await Reminder.due_unclaimed(now + LOOKAHEAD, now).prefetch_related("user")
+
+        for reminder in reminders:
+            if reminder.id in self._due:
+                continue
+            if self._backlog_cutoff is not None and reminder.due_at <= self._backlog_cutoff:
+                continue
+            self.add_reminder(reminder)
+
+        reminders = [r for r in reminders if r.id in self._due and r.id not in self._prepared]
+        if not reminders:
+            return
+
+        prepared = await asyncio.gather(*(self.prepare_reminder(reminder) for reminder in reminders))
+        for item in prepared:
+            # The reminder might have been removed or fired while its DM channel was being opened
+            if item.reminder.id in self._due:
+                self._prepared[item.reminder.id] = item
+        logger.debug(f"Prepared {len(prepared)} upcoming reminders")
+
+    async def _prefetch_loop(self) -> None:
+        while True:
+            try:
+                await self._prefetch()
+            except Exception:
+                logger.exception("Failed to prefetch upcoming reminders")
+            await asyncio.sleep(PREFETCH_INTERVAL)
+
+    async def _deliver(self, group: Sequence[PreparedReminder]) -> None:
+        async with self._semaphore:
+            try:
+                if len(group) == 1:
+                    await self.send_reminder(group[0])
+                else:
+                    await self.send_digest(group)
+            except Exception:
+                logger.exception(f"Failed to send reminders {[item.reminder.id for item in group]}")
+
+    async def _fire_batch(self, due_reminders: dict[int, float]) -> None:
+        try:
+            await self._deliver_batch(due_reminders)
+        except Exception:
+            logger.exception("Failed to fire reminders")
+
+    async def _deliver_batch(self, due_reminders: dict[int, float]) -> None:
+        token = await self._claim(due_reminders)
+        async with self._hold_lease(token):
+            await self._deliver_claimed(token, due_reminders)
+
+    async def _deliver_claimed(self, token: str, due_reminders: dict[int, float]) -> None:
+        claimed: list[Reminder] = await Reminder.claimed(token).prefetch_related("user")
+
+        # Prepared reminders keep their DM channel and rendered message, but the claimed row is fresher
+        prepared = [
+            self._prepared[reminder.id]._replace(reminder=reminder)
+            for reminder in claimed
+            if reminder.id in self._prepared
+        ]
+        missing = [reminder for reminder in claimed if reminder.id not in self._prepared]
+        prepared.extend(await asyncio.gather(*(self.prepare_reminder(reminder) for reminder in missing)))
+        for reminder_id in due_reminders:
+            self._prepared.pop(reminder_id, None)
+        if not prepared:
+            return
+
+        started_at = time.time()
+        groups = self._group_digests(prepared) if DIGEST_WINDOW > 0 else [(item,) for item in prepared]
+        await asyncio.gather(*(self._deliver(group) for group in groups))
+
+        lateness = [started_at - due_reminders[item.reminder.id] for item in prepared]
+        logger.info(
+            f"Delivered a batch of {len(prepared)} reminders in {len(groups)} messages "
+            f"in {time.time() - started_at:.2f}s, "
+            f"lateness avg={sum(lateness) / len(lateness):.2f}s max={max(lateness):.2f}s"
+        )
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+
+            entry = self._peek()
+            if entry is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = entry[0] - time.time()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                continue
+
+            now = time.time()
+            due_reminders = self._pop_due(now)
+            if DIGEST_WINDOW > 0:
+                due_reminders |= self._pop_digest_companions(due_reminders, now + DIGEST_WINDOW)
+
+            # A large batch can take a while to deliver, reminders falling due meanwhile must not wait for it
+            task = asyncio.create_task(self._fire_batch(due_reminders))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    def cancel_task(self) -> None:
+        for task in (self.current_task, self.prefetch_task, self.catchup_task, *self._batch_tasks):
+            if task is not None:
+                task.cancel()
+        self._batch_tasks.clear()
+        self.current_task = None
+        self.prefetch_task = None
+        self.catchup_task = None
@@ -65,6 +65,12 @@ def get_now(timezone: int) -> datetime.datetime:
     return datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=timezone)))
 
 
+def local_midnight(date: datetime.date, timezone: int) -> datetime.datetime:
+    """Get the instant at which the given date starts in the given hour offset from UTC."""
+    tz = datetime.timezone(datetime.timedelta(hours=timezone))
+    return datetime.datetime.combine(date, datetime.time(), tzinfo=tz).astimezone(datetime.UTC)
+
+
 def shorten_text(text: str, max_length: int) -> str:
     if len(text) <= max_length:
         return text
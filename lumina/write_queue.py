@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+from tortoise import connections
+from tortoise.transactions import in_transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from tortoise import Model
+    from tortoise.backends.base.client import BaseDBAsyncClient
+
+WRITE_BATCH_WINDOW = int(os.getenv("WRITE_BATCH_WINDOW_MS", "0")) / 1000
+"""How long, in seconds, a write may wait for others to share its transaction, 0 to commit every write on its own."""
+MAX_WRITE_BATCH_SIZE = 100
+"""Writes are committed early once this many are waiting."""
+
+type Write[T] = Callable[[BaseDBAsyncClient], Awaitable[T]]
+
+
+class WriteQueue:
+    """Coalesces small writes into group commits, so a burst of writes costs one fsync instead of one each.
+
+    Each write runs in its own savepoint, a failing write only rolls back itself and raises to its caller.
+    """
+
+    def __init__(self, *, window: float, max_batch_size: int) -> None:
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self.batches = 0
+        self.writes = 0
+        self.largest_batch = 0
+
+        self._pending: list[tuple[Write[Any], asyncio.Future[Any]]] = []
+        self._full = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+
+    async def submit[T](self, write: Write[T]) -> T:
+        """Run a write in the next group commit and wait for its result."""
+        if self.window <= 0:
+            return await write(connections.get("default"))
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._pending.append((write, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._full.set()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_soon())
+        return await future
+
+    async def create[M: Model](self, model: type[M], **kwargs: Any) -> M:
+        return await self.submit(lambda db: model.create(using_db=db, **kwargs))
+
+    async def save(self, obj: Model, *, update_fields: Iterable[str]) -> None:
+        await self.submit(lambda db: obj.save(using_db=db, update_fields=update_fields))
+
+    async def delete(self, obj: Model) -> None:
+        await self.submit(lambda db: obj.delete(using_db=db))
+
+    async def drain(self) -> None:
+        """Commit the writes that are still waiting, used on shutdown."""
+        if self._flush_task is not None:
+            self._full.set()
+            await asyncio.shield(self._flush_task)
+
+    def get_stats(self) -> str:
+        average = self.writes / self.batches if self.batches else 0
+        return f"{self.writes} writes in {self.batches} batches, average {average:.1f}, largest {self.largest_batch}"
+
+    async def _flush_soon(self) -> None:
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._full.wait(), timeout=self.window)
+            while self._pending:
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                await self._commit(batch)
+        finally:
+            self._full.clear()
+            self._flush_task = None
+
+    async def _commit(self, batch: list[tuple[Write[Any], asyncio.Future[Any]]]) -> None:
+        self.batches += 1
+        self.writes += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        try:
+            results = await self._run_batch(batch)
+        except Exception as e:
+            logger.exception(f"Failed to commit a batch of {len(batch)} writes")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), (result, error) in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    async def _run_batch(batch: list[tuple[Write[Any], asyncio.Future[Any]]]) -> list[tuple[Any, Exception | None]]:
+        results: list[tuple[Any, Exception | None]] = []
+        async with in_transaction():
+            for write, _ in batch:
+                try:
+                    async with in_transaction() as savepoint:
+                        results.append((await write(savepoint), None))
+                except Exception as e:
+                    results.append((None, e))
+        return results
+
+
+write_queue = WriteQueue(window=WRITE_BATCH_WINDOW, max_batch_size=MAX_WRITE_BATCH_SIZE)
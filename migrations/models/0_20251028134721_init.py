@@ -4,6 +4,54 @@ RUN_IN_TRANSACTION = True
 
 
 async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "luminauser" (
+    "id" BIGINT NOT NULL PRIMARY KEY,
+    "timezone" SMALLINT NOT NULL DEFAULT 0,
+    "lang" VARCHAR(5)
+);
+CREATE TABLE IF NOT EXISTS "birthday" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "bday_user_id" BIGINT NOT NULL,
+    "bday_username" VARCHAR(100),
+    "month" INT NOT NULL,
+    "day" INT NOT NULL,
+    "leap_year_notify_month" INT,
+    "leap_year_notify_day" INT,
+    "last_notify_year" INT NOT NULL DEFAULT 0,
+    "user_id" BIGINT NOT NULL REFERENCES "luminauser" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_birthday_bday_us_1b4a02" UNIQUE ("bday_user_id", "user_id", "bday_username")
+);
+CREATE TABLE IF NOT EXISTS "notes" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "title" VARCHAR(100) NOT NULL,
+    "content" TEXT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "user_id" BIGINT NOT NULL REFERENCES "luminauser" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "reminder" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "text" TEXT NOT NULL,
+    "datetime" TIMESTAMPTZ NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "message_url" TEXT,
+    "sent" BOOL NOT NULL DEFAULT False,
+    "user_id" BIGINT NOT NULL REFERENCES "luminauser" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "todotask" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "text" TEXT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "done" BOOL NOT NULL DEFAULT False,
+    "user_id" BIGINT NOT NULL REFERENCES "luminauser" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSONB NOT NULL
+);"""
     return """
         CREATE TABLE IF NOT EXISTS "luminauser" (
     "id" BIGINT NOT NULL PRIMARY KEY,
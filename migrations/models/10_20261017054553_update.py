@@ -0,0 +1,58 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "reminder" ADD "delivered_at" TIMESTAMPTZ;"""
+    return """
+        ALTER TABLE "reminder" ADD "delivered_at" TIMESTAMP;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "reminder" DROP COLUMN "delivered_at";"""
+
+
+MODELS_STATE = (
+    "eJztXFtz2ygU/iuMX7adyXZS57r7Zidpm21idxJ3t9NMRsUStrWRQAWc1tvJf1/Q/YIUy4"
+    "4vSniyfTgHwSfgfJwD/tVyiYUc9qYLzbuR7TgnE2TeecTGvPUn+NXC0EXiS4XWDmhBz0t0"
+    "pIDDoeObDUN9M6s/ZJxCUz5hBB2GhMhCzKS2x22ChRRPHUcKiSkUbTxORFNsf58ig5Mx4h"
+    "NERcHNrRDb2EI/EYt+enfGyEaOlemC/ykK/RKDzzxfejKB9J2vKx84NEziTF2c1vdmfEJw"
+    "bCBaJKVjhBGFHFmpTsg2hj2PREF7hYDTKYobaiUCC43g1OGpTs+JhEmwRFFAyvxuuvCn4S"
+    "A85hPx8+3u7kPQn6S3gZrswt+dq5MPnatXQuu17AsRLyN4X72wqB2UPfiVQA6Danx8E0Ad"
+    "yLhhW0VMu/b4HHM1qimjHLDh4KgLbCRIkE3GVATt7hK4juVDfv+j3d7bO2rv7h0eH+wfHR"
+    "0c7x4LXb9FxaKjCuy75+/Pe4Ms6lIgoU6g9SgxEWOoJrgZMw1vKbwWwYqloEuIgyBWQxuZ"
+    "5FAdCptVwVp3bcxBW4VSv38hW+0y9t0JYMth1vt82T0TK4S/Pgglm5dAOfUs2W0D8iKgp6"
+    "KE2y5SI5q1zOFqhaZvoi+rAnnJVZciaPWxMwsX9ArMB+eXZ9eDzuWnDPCnncGZLGn70llO"
+    "+uowtz7HlYB/zgcfgPwJvvZ7Zz6ChPEx9Z+Y6A2+tmSb4JQTA5MfBrRSvieSRo2XrnN0l1"
+    "rrpUC68B+QWkahhLRJmW6xyG27eQnEcOy/FYmtbGVEMmzKJxacKQlIVFZNO9JaT0o2blpD"
+    "Ua8xZYiGXkx+lZ+x3G/xbY6V3AR6t6XspK4fndeFhq96o9RkjWt8OVvJv7f5oc5brs+xNg"
+    "d3Bc51+XbBcCHiHY7ddcK8KuadXvywqLyAZemIjfUbNlTbb/eP9o/3DvfjERpLqgamguAF"
+    "a/+ccIXaLxUsQXo9Y4YgFVyA26OZUXe4lVewEKQbmMKrRrTeeCwzf6loypBBiIREpQ6SCt"
+    "Mm7YufDMNkIDFjiEaEKlxzKYpq45c8GsVQcmbLjEllBS9zZKKf8RStH0QoWj9BIOHxQfrE"
+    "O6SGhA0iHFJxA19UfJ+Z4b3gW1XUod/tZt/tQttnvXOu2DkXQm5ZsItIvxPe1x7jj2jmo3"
+    "0u2g2xqXLIYcTsYuraGH4OK9s+rB+i8RJJkylI4Y84UpYeRqKTomsoCEmfdK5POqdnrYfN"
+    "BCtPbWYSan2iZGT7EBZCljmNnarApRXoeindx8KXrcEEAQ9SzgAZAQjCxwGJF8AIWcgCnA"
+    "CKxBukIIqMsh3ACPAXV9uEsioGLIJ/42AC75E0GCFuTgAXlcua3rRyL3ONj10i57uqqOpW"
+    "ZHy3IqwqRqznQOGna0b78nZPk2V/FtE+eC/ApsaUOkVAB4IZqQHNWjUFzip2dPZlkCFGEW"
+    "ivLjtfXmfI0UW/9z5ST4F8ctHv5rD1l5eF0pVZy/WkKzUVzVDRLclPphiVwt1n+Va5q3d8"
+    "vYjkbeZIlHaPq3aPci34T3na5NqFjlOKdNquSWGhvfbRYQyw/FEF6fVl5+JCFWETz6lBJS"
+    "L9RuYLD+bgDwel7OEgzx0s1zAnEGPk1N6nF0ybFeDdxGa93P+k8uHR1kfxNkLTdx+vkOPv"
+    "hsq38emDL1tL4wqb+HwOAi2JQi+qoqEQUOTKFtAlYbgKq2kwEpxYZEkUBqKKAWR3DUNhld"
+    "Q0mB8KVhpPnHJCGk/P7eGiz+j025L5siqGyZ1akZfYoCkxgjWEXMQTOcKKmEB5vCVl0hQg"
+    "1x1sMSla8Gx41lKfDd/o2XCdB9R5QJ0HfIR5xZRcQb7SdL2cf9G01iop2E2LhY4rXkCFRi"
+    "L1T19AzpHryc+gMBqFWRPTgeK7ZQxnNa82aGY3B7MT76EOI4n0NR1R05E0XahDRtJ2zaQi"
+    "DaEec51B0qTymZJKFzEmfGvdvHfOrCFJgHWvfUy5u6288czUu9sXf+NZEDf7HtGFlqC87V"
+    "oOtGpvUr7ohDRXEYmuzs+m7V5afja/P6g5BxTmehpseBoEd1IoJYpIQ7nrzVppz6sOgiZb"
+    "5AK05UH6rFVDoF1DoF7QFSa4Hua2giRWrzs5U73m6Msk65kVOoisg8jzBZHliYYONSdij9"
+    "BSxJHTxTtVoWR5uAKmFB+9Q3JKMAIcsjsGXHKPLECmXN7r+BadsfgGhjP/VgZFMuspzMC/"
+    "ZLgD7pDHgUlcT1QPIBaGo5GvNyEc+O0p3hxZ9cO27RDCFp2GXVmselsX8wYfKtaJgJVR8h"
+    "cdQn5OHFL+K+MiYbjETG8DNh2BC3jKIrMxZ9rM6fjMMjpbckcrPhtcQqOjc8PVHJpHWqs9"
+    "jhGfrQgv/KS8jD5VoU9VaDKlV+8N5OP1n2Q/XcpY09Qtngw6Wq2j1TpaXZ9jdxC1zUlLwb"
+    "DDkkp+DRMdfd+sQfz5HlEWXsucN5mdMmkKi86mstsH81zTF1qlqWy/LPc3P2Jq1AAxVG8m"
+    "gOu9tPfXdb9XsuUovbT3GYsO3li2yXeAYzN+u52wVqAoe129u8tv5HI0SVbQrfc3B0/vXh"
+    "7+B27Hsbg="
+)
@@ -0,0 +1,55 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX "idx_todotask_done_41af70" ON "todotask" ("done", "done_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_todotask_done_41af70";"""
+
+
+MODELS_STATE = (
+    "eJztXFtz2ygU/iuMX7adyXZS57r7Zidpm21idxJ3t9NMRsUStrWRQAWc1tvJf1/Q/YIUy4"
+    "4vSniyfTgHwSc4fJwD/tVyiYUc9qYLzbuR7TgnE2TeecTGvPUn+NXC0EXiS4XWDmhBz0t0"
+    "pIDDoeObDUN9M6s/ZJxCUz5hBB2GhMhCzKS2x22ChRRPHUcKiSkUbTxORFNsf58ig5Mx4h"
+    "NERcHNrRDb2EI/EYt+enfGyEaOlemC/ykK/RKDzzxfejKB9J2vKx84NEziTF2c1vdmfEJw"
+    "bCBaJKVjhBGFHFmpTsg2hj2PREF7hYDTKYobaiUCC43g1OGpTs+JhEmwRFFAyvxuuvCn4S"
+    "A85hPx8+3u7kPQn6S3gZrswt+dq5MPnatXQuu17AsRLyN4X72wqB2UPfiVQA6Danx8E0Ad"
+    "yLhhW0VMu/b4HHM1qimjHLDh4KgLbCRIkE3GVATt7hK4juVDfv+j3d7bO2rv7h0eH+wfHR"
+    "0c7x4LXb9FxaKjCuy75+/Pe4Ms6lIgoU6g9SgxEWOoJrgZMw1vKbwWwQpX0CXEQRCroY1M"
+    "cqgOhc2qYK3rG3PQVqHU71/IVruMfXcC2HKY9T5fds+Eh/D9g1CyeQmUU8+S3TYgLwJ6Kk"
+    "q47SI1olnLHK5WaPom+rIqkJf0uhRBq4+dWejQKzAfnF+eXQ86l58ywJ92BmeypO1LZznp"
+    "q8Ocf44rAf+cDz4A+RN87ffOfAQJ42PqPzHRG3xtyTbBKScGJj8MaKXWnkgaNV4unaO7lK"
+    "+XArmE/4DUMgolpE3KdItFbtvNSyCGY/+tSGxlKyOSYVM+seBMSUCismrakdZ6UrJx0xqK"
+    "eo0pQzRcxeRX+RnL/Rbf5ljJTaB3W8pO6q6j8y6h4aveKDVZo48vZyv59zY/1HnL9S2szc"
+    "FdgXNdvl0wXIh4h2N3nTCvinmnnR8WlRewLB2xsX7Dhmr77f7R/vHe4X48QmNJ1cBUELzA"
+    "988JV6j9UsESpNczZghSwQW4PZoZdYdbeQULQbqBKbxqROuNxzLzl4qmDBmESEhU6iCpMG"
+    "3SvvjJMEwGEjOGaESoYmkuRVFt/JJHoxhKzmyZMams4GWOTPQznqL1gwhF6ycIJDw+SJ94"
+    "h9SQsEGEQypu4IuK7zMzvBd8q4o69Lvd7LtdaPusd84VO+dCyC0LdhHpd2L1tcf4I5r5aJ"
+    "+LdkNsqhbkMGJ2MXVtDD+HlW0f1g/ReImkyRSk8EccKUsPI9FJ0TUUhKRPOtcnndOz1sNm"
+    "gpWnNjMJtT5RMrJ9CAshy5zGTlXg0gp0vZTuY+HL1mCCgAcpZ4CMAATh44DEC2CELGQBTg"
+    "BF4g1SEEVG2Q5gBPjO1TahrIoBi+DfOJjAeyQNRoibE8BF5bKmN63cy1zjY5fI+a4qqroV"
+    "Gd+tCKuKEes5UKzTNaN9ebunybI/i2gfvBdgU2NKnSKgA8GM1IBmrZoCZxU7OvsyyBCjCL"
+    "RXl50vrzPk6KLfex+pp0A+ueh3c9j67mWhdGXWcj3pSk1FM1R0S/KTKUalWO6zfKt8qXd8"
+    "vYjkbeZIlF4eV708Sl/wn/K0ybULHacU6bRdk8JCe+2jwxhg+aMK0uvLzsWFKsImnlODSk"
+    "T6jcwXHszBHw5K2cNBnjtYrmFOIMbIqb1PL5g2K8C7ic16+fqTyodHWx/F2whN3328Qo6/"
+    "GyrfxqcPvmwtjSts4vM5CLQkCr2oioZCQJErW0CXhOEqrKbBSHBikSVRGIgqBpDdNQyFVV"
+    "LTYH4oWGk8ccoJaTw9t4eLPqPTb0vmy6oYJndqRV5ig6bECNYQchFP5AgrYgLl8ZaUSVOA"
+    "XHewxaRowbPhWUt9NnyjZ8N1HlDnAXUe8BHmFVNyBflK0/Vy/kXTWqukYDctFi5csQMVGo"
+    "nUP30BOUeuJz+DwmgUZk1MB4rvljGc1bzaoJndHMxOvIc6jCTS13RETUfSdKEOGUnbNZOK"
+    "NIR6zHUGSZPKZ0oqXcSYWFvr5r1zZg1JAqzb9zHl7rbyxjNT725f/I1nQdzse0QXckF527"
+    "UcaNWrSbnTCWmuIhJdnZ9N2720/Gx+f1BzDijM9TTY8DQI7qRQShSRhvKlN2ulV151EDTZ"
+    "IhegLQ/SZ60aAu0aAvWCrjDB9TC3FSSx2u/kTLXP0ZdJ1jMrdBBZB5HnCyLLEw0dak7EHq"
+    "GliCOni3eqQsnycAVMKT56h+SUYAQ4ZHcMuOQeWYBMubzX8S06Y/ENDGf+rQyKZNZTmIF/"
+    "yXAH3CGPA5O4nqgeQCwMRyNfb0I48NtTvDmy6odt2yGELToNu7JY9bY68wYfKtaJgJVR8h"
+    "cdQn5OHFL+K+MiYbjETG8DNh2BC3jKIrMxZ9rM6fjMMjpbckcrPhtcQqOjc8PVHJpHWqs9"
+    "jhGfrQgv/KRWGf+URSSP3JY+aqGPWmiGpV36BpL0+p+zny6PrLnrFk8GHcLWIWwdwq5PvD"
+    "uI2uakpaDdYUkl6YaJjr6E1iD+fI8oC+9qzpvhTpk0hUVn89vtg3nu7gut0vy2X5b77x8x"
+    "NWqAGKo3E8D13uT767rfK9lylN7k+4xFB28s2+Q7wLEZv91OWCtQlL2u3t3lN3I5miQr6N"
+    "b774OnX14e/gekaLgQ"
+)
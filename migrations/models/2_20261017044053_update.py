@@ -0,0 +1,53 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "reminder" ADD "last_error" TEXT;
+        ALTER TABLE "reminder" ADD "attempts" SMALLINT NOT NULL DEFAULT 0;
+        ALTER TABLE "reminder" ADD "next_attempt_at" TIMESTAMPTZ;"""
+    return """
+        ALTER TABLE "reminder" ADD "last_error" TEXT;
+        ALTER TABLE "reminder" ADD "attempts" SMALLINT NOT NULL DEFAULT 0;
+        ALTER TABLE "reminder" ADD "next_attempt_at" TIMESTAMP;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "reminder" DROP COLUMN "last_error";
+        ALTER TABLE "reminder" DROP COLUMN "attempts";
+        ALTER TABLE "reminder" DROP COLUMN "next_attempt_at";"""
+
+
+MODELS_STATE = (
+    "eJztmltz2jgUx78Kw1M6k+1QE0J23yAhLVsuO4HsdprJeAQW4IksUVnehO3ku68k343s2i"
+    "EXHPyUcHSOsH4cSX8d62fdIgZE9seuSdnKAJv6H7WfdQwsyP/Zajuu1cF6HbYIAwMzJJ1n"
+    "Ua+ZzSiYM25fAGRDbjKgPafmmpkEcyt2EBJGMueOJl6GJgebPxyoM7KEbAUpb7i5qc94v7"
+    "pjQ6qbhuhf/Cv+Bnb5xLe33GRiAz5AW8SJj+s7fWFCZMTG5XYi7TrbrKWtay77mF1KX/Fk"
+    "M31OkGPh0H+9YSuCgwATM2FdQgwpYFB8A6OOGKoYiUfFH707qtDFfcpIjAEXwEEsgiYnrz"
+    "nBgjV/GluOcSm+5bffNa3ZbGuN5ulZ66Tdbp01zrivfKTtpvajO+AQiNuVxNL/3B9NxUAJ"
+    "/0HdX1oYHmUMYMCNkrxDwMnfKz/qZOSvofuIs6j7hhB7mJbl467gLA1boM9XgP4Csx+Y4M"
+    "yHloOzl7uvidkCDzqCeMlW/OOnRiMD4d+dq/Mvnasj7vUhDnLkNWluW5ypRTDvfItlasYG"
+    "/iVLVe3TSfvkrHl6EmRoYMlKzO0k9Nb8nLg870OFhSBY6xsIqI4JMxcbvWi6pXfwJKRvMI"
+    "VfmmixfEwLP1SawGY+CUGlCElF6OtN88b+MAwTydZncEGoYmtOpagOPuRs5KmENrvkpLKD"
+    "g8zMJ0nySo1nqHFxxlzcKQ9B/iE1TvqSz2hzib/CjaTd588N8Fw1yb3T98CxTAyuvc72j/"
+    "Wjny++NVx5KLgPTt/RNOKD5EODzD2kdCbnnYteXaKcgfndPaCGHmMqWohGEpbAd7vJ0qyk"
+    "BWCwlOMXoxDPvI1XUfqIw08vfiDp5//iz1v+eOuqRp40O4yyBjMt+B/Biu18YgGEUklH48"
+    "q07zS19mkAWHzIQjoZdgYD1RbOv2eLV3plwvcvZUGilaMc0UotRrQ+qDaU9GUxUgfyaq+2"
+    "YgXwQi+/XkEE5PBSt5poobc8G01Se8MdKYz8LkqKgEJLPAHdEcOV102JSTBikB0pTHkXU2"
+    "DflYzCSyomd34oxFIwcdJ1UjA990civaO3PjueE7OED0OF3i8EAU/axt/ixPjyLxb4NzLo"
+    "pk8c4xQ+pKRgJKQsIDO4TXvfpOS2bPsHiuI6Gna+SZLWxmsZjEefffcI3vPBuJukSqEYvw"
+    "4UYC94i9DeKXBjkQm+hhf60f9nP2nzzR4YY4w24faXSr8/7E2mneFfsZ/gojPtiRYtht+3"
+    "Hp0mEjzopPZPf/qlJj7Wvo9HPUmQ2GxJ5TeGftPvdfFMwGFEx+ReB0Zk+fOtPpiqVlXVqt"
+    "5ELx2Xo1YVSHKF+IrK9XT9RaNelQQrkwTjIqGIdPD9K92g1g3Rfb2IaojGlVMzlEQj+MPO"
+    "FAmV+nun6s+Cts03Qd2hqMiqlwgrSRH5tdc+W3kM7RKCIMBqsLb6GDrjMS81N4qKkvxQu+"
+    "PxIAa1209Sux52e/yELwlzJ5PFXhGFKAFj0FozRZUx+5VQNO7QXglhPn11D8ATVm5F+DMs"
+    "3/s16/dotc61D7v3bCglilNk+modj6oWa+ViXdVBjqs6SFUHidZBgpdyijpI9IVdeh1EvB"
+    "lkvldVB3n+aVzVQUqyvVQn6Hd6gjaUF9UyD3mG+o7awR/yKglWSbBKgsUkWAdSc75SCTCv"
+    "JVN+gdCnEl8lEl//Qmp71+Xy3gSKhJRFgsXvAmmtPLd6uVfqXSDZligb8qlRAKLnXk6Ar3"
+    "uZ6s/JeFT0MtU15gO8Mcw5O64h02a3+4k1g6IYdfbRIHkKSAhO0UG32PXz599eHv8H9gnq"
+    "8w=="
+)
@@ -0,0 +1,50 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "reminder" ADD "claimed_by" VARCHAR(100);
+        ALTER TABLE "reminder" ADD "lease_until" TIMESTAMPTZ;"""
+    return """
+        ALTER TABLE "reminder" ADD "claimed_by" VARCHAR(100);
+        ALTER TABLE "reminder" ADD "lease_until" TIMESTAMP;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "reminder" DROP COLUMN "claimed_by";
+        ALTER TABLE "reminder" DROP COLUMN "lease_until";"""
+
+
+MODELS_STATE = (
+    "eJztm11v4jgUhv8K4qojdUcMlNLdO2jpDDt8rArdHU1VRYYYiOrYjG22ZUf972s738HJkN"
+    "ICKbkqHJ/jxA/H9uuT9GfZJiZE7GPLonxuglX5j9LPMgY2FB/W2k5LZbBYBC3SwMEYKedx"
+    "2GvMOAUTLuxTgBgUJhOyCbUW3CJYWPESIWkkE+Fo4VlgWmLrxxIanMwgn0MqGu7uymPRr7"
+    "FkkBqWKfuXH+Vf367u+P5emCxswifIZJz8ungwphZEZmRcTifKbvDVQtla1qyD+bXylXc2"
+    "NiYELW0c+C9WfE6wH2BhLq0ziCEFHMorcLqUQ5Ujcal4o3dGFbg4dxmKMeEULBEPodmQ14"
+    "RgyVrcDVNjnMmr/PZ7tVqrNaqV2vlF/azRqF9ULoSvuqX1psazM+AAiNOVwtL53OmP5ECJ"
+    "+EGdX1oanlUM4MCJUrwDwPHfa3PU8chfQ/cQp1H3DAH2IC3zx13DWRnWQF/OAf0FZi8wxl"
+    "kMbQPObu7uErMNngwE8YzPxddPlUoKwr+bN5dfmjcnwutDFGTfbao6bVGmNsGi8zWWiRnr"
+    "++csVaufzhpnF7XzMz9DfUtaYq4nobvmb4jL9T5WWAiChbGCgBqYcGu6MrKmW3IHL0K6hy"
+    "n81kSz5WNS+LHSBIx7JCSVLCQ1obub5pXDYRgkEjPGcEqoZmtOpKgPPuZsFKmEVtvkpLaD"
+    "o8zMF0nyQo2nqHF5xpw+aA9B3iE1SvpazGhrhr/ClaLdEfcN8EQ3yd3Td3dpWxjcup0dHu"
+    "tnL188a7DyUPDon77DaSQGKYYGuXNIaQ4vm1ftskI5BpOHR0BNI8JUtpAqiVl83/Umu2rH"
+    "LQCDmRq/HIW853W8mtJHFH5y8QMpP+8Xf93yx76rGpuk2XGUNbhlw/8I1mznQxsglEg6HJ"
+    "enfadWbZz7gOWXNKTDXrPb1W3h4jprvJIrE55/LgsS9Q3KEfXEYkT9g25DSV4WQ3Ugt/bK"
+    "NCuAG3r99QYioIaXuNWEC7352Wji2htuSaHvdZFTBBTa8g7olhhu3G5yTIITk2xJYSS6GA"
+    "H2kDMKb6mYnPmhEUv+xEnWSf70PByJ9I6e+mx5TkwTPhxler7gB7xoG9/HifHtHyyIK3Lo"
+    "pE8U4wg+JaRgKCQvIFO4jdrflOS2GfuBwrhOes1viqS9clu6g/5nzz2E97I7aMWpUijHbw"
+    "AN2CvRIrV3AtxIZIyv6YZ+9D4cJm2x2QNzgNEq2P4S6Xd67eGo2fsr8hNcNUdt2VKN4Pes"
+    "J+exBPc7Kf3TGX0pya+l74N+WxEkjM+oumLgN/pelvcElpwYmDwawAwtf57VA1PUqopa1V"
+    "700mk+alW+JNeIr7BcT9ZfNOxVSLA8STAhErJIB8+/0A163RDe17OohnBcPjVDTjSCN+xU"
+    "kVCov3eq/mzImNgEjSVFWVa9WFhOisi7XvuY9hjaIgRBgPVgmf4YOhYxbzU3soqSzaG2Bo"
+    "NuBGqrE6d222u1xQlfERZOFo88IgpQAs6hveCaKmP6I6Fw3LE9EsJi+hougBes3JrwV1i+"
+    "D2vWH9BqvdE+7LxnQynRnCKTV+toVLFY6wtcCIgMNo2x5q3G5AJsNConaHdQhBU7HBPyAH"
+    "NLoyvS151YaLHm7HnNKQqEp0WBsCgQhguE/tNqTYEw/CQ7uUAoH5lzz6soEL7+NC4KhHnR"
+    "XUVp6X2WlkztG5yp1Q9T//Lm0Vc/CglWSLBCgkUkWBNSazLXCTC3JVV+gcCnEF85El//Qs"
+    "rc90g3rdCEQvIiwaL1mWp9k9fdhVdifUa1xerpYmpkgOi65xPgbt8y/HM46Gd9y/AWiwHe"
+    "mdaEn5aQxfj9YWJNoShHnX40iJ8CYoJTdtDK9n8Zr7+9PP8PxoHoLQ=="
+)
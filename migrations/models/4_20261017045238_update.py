@@ -0,0 +1,57 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        ALTER TABLE "birthday" ADD "next_notify_at" TIMESTAMPTZ;
+        ALTER TABLE "birthday" ADD "next_early_notify_at" TIMESTAMPTZ;
+        CREATE INDEX "idx_birthday_next_no_31bf2d" ON "birthday" ("next_notify_at");
+        CREATE INDEX "idx_birthday_next_ea_816aa0" ON "birthday" ("next_early_notify_at");"""
+    return """
+        ALTER TABLE "birthday" ADD "next_notify_at" TIMESTAMP;
+        ALTER TABLE "birthday" ADD "next_early_notify_at" TIMESTAMP;
+        CREATE INDEX "idx_birthday_next_no_31bf2d" ON "birthday" ("next_notify_at");
+        CREATE INDEX "idx_birthday_next_ea_816aa0" ON "birthday" ("next_early_notify_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_birthday_next_ea_816aa0";
+        DROP INDEX IF EXISTS "idx_birthday_next_no_31bf2d";
+        ALTER TABLE "birthday" DROP COLUMN "next_notify_at";
+        ALTER TABLE "birthday" DROP COLUMN "next_early_notify_at";"""
+
+
+MODELS_STATE = (
+    "eJztW+9T4jgY/lcYPumMt8OiiHffwMVdbhFuFO921nE6gQbomCZsEk65Hf/3S9LfbdptEd"
+    "FKP0nfvG+aPH2TPHkSf9ZtYkLEPnQtyhcmWNf/qP2sY2BD8SNRdlSrg+UyKJEGDiZIOU/C"
+    "XhPGKZhyYZ8BxKAwmZBNqbXkFsHCilcISSOZCkcLzwPTCls/VtDgZA75AlJRcHtbn4h6jR"
+    "WD1LBMWb/8Kf/6dtXiuzthsrAJHyGTcfJxeW/MLIjMSL+cSpTd4OulsnWteR/zC+UrWzYx"
+    "pgStbBz4L9d8QbAfYGEurXOIIQUcyjdwupJdlT1xUfF67/QqcHFaGYox4QysEA9BkxOvKc"
+    "ESa9Eapvo4l2/57fdm8/i43Wwcn561Ttrt1lnjTPiqJiWL2k9OhwNAnKoULP3P/eFYdpSI"
+    "D+p8aWl4UjGAAydK4R0AHP9e+aGOR/4adA/iLNQ9QwB7kJblw12DszIkgD5fAPoLmL3AGM"
+    "6iazlwdnN3lzDb4NFAEM/5Qjx+bDQyIPy7c3X+pXN1ILwOo0AO3aKmUxbF1CZYVJ7AMjVj"
+    "ff+SpWrz40n75Oz49MTPUN+SlZjJJHTn/Jxwud77ChaCYGmsIaAGJtyarY2i6ZZewUaQvs"
+    "IQfmlEi+VjWvi+ogkY95CQqBRBUhO6u2HeeDsYBonEjAmcEapZmlNR1AfvczaKVELr5+Sk"
+    "toL9zEz46A9RwJM4fhJd55YNU1IzER0D0XTDP3g/tpKkW94hZQA27l/2rsedy79ku23Gfi"
+    "AFSmfckyVNZV3HrAenMXLpV1L7pz/+UpOPte+jYU/hRRifU/XGwG/8vS7bBFacCHQfDGCG"
+    "ofLMnin5PSPpveFX1dRRfdvX/bYbbZ+rnXPGzlnqQbN7rWDhCUpRpC/E6mvN8Ve4Vmj3Rb"
+    "sBnuoWZFcpG6xsC4Mbt7K3h/WTly+eNRiCFDz4Slk4jUQnRdcgdwSFzvV551OvrqCcgOn9"
+    "A6CmEcFUlpAmiVl832SR3bTjFoDBXPVf9kK2OQmvRqaMgp8uVCLl533x7UqVr61A5kmz/Z"
+    "Ag5RL1H8Ea6n1tA4RSkQ7HlYkjHjfbpz7A8iEL0uvLzmCgo9viPQm80lVEz7+U4mErh3TY"
+    "ShUOW4e6BSV9Wgxptu45CdPMAG7oxdcriIDqXupSEz6UKc9CE98nw2eiMPSqKCkEFNqyBf"
+    "SZMFy51ZQYCU5M8kwUxqKKMWD3JUPhJRmTMz40ZMkfOOk8yR+eb4civaMT2mdqOlnEh6NC"
+    "Z4F+wEbL+GvsGF/+EFC8kUOs0VLG8DElBUMhZQEySy7pfRtHlBIProPLzrfDiFoyGA0/e+"
+    "4heM8Ho24cVQpl/zcQqaKRW5CmXiNtRR/MEUbrYPkrg1jlTn+VVlVpVW+CLx2VQ6vyKbmG"
+    "fIXpejr/omGvioKViYIJklCEOnj+FW/Q84bwul6ENYTjyskZSsIRch1oVezvnbI/GzImFk"
+    "FjRVGRWS8WVhIReddzH9NuQ7uEIAiwHlim34ZORMxLjY2ipCQ/qN3RaBABtduPo3Zz2e2J"
+    "Hb5CWDhZPHJEFEAJOIf2kmtUxuwjoXDcvh0JqdshLgCbXi6Jhu/kXkm1DqdP186dOEqJZh"
+    "eZPltHo6rJWi9wISAy2DQmmhvI6QJsNKok0O5AhBUrHBP0AHNLwyuy551YaDXnVJfZdjMq"
+    "KoGwEgjzCYT+abVGIAyfZKcLhPLInHtelUC4/WFcCYRl4V2VtPQ+pSVTe4MzU/0w9Zc391"
+    "79qChYRcEqChahYB1IrelCR8Dckkz6BQKfinyViHz9Cylz75HmVWhCIWWhYFF9ptnKc91d"
+    "eKXqM6ospqeLoVEARNe9nADu9pbhn9ejYdFbhjdYdPDWtKb8qIYsxu/eJqwZKMpeZ28N4r"
+    "uAGOGUFXSL/V/G9peXp/8BF/MXkw=="
+)
@@ -0,0 +1,56 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX "idx_birthday_user_id_f53805" ON "birthday" ("user_id");
+        CREATE INDEX "idx_reminder_sent_0c4604" ON "reminder" ("sent", "next_attempt_at");
+        CREATE INDEX "idx_reminder_claimed_c0c524" ON "reminder" ("claimed_by");
+        CREATE INDEX "idx_reminder_sent_27ea29" ON "reminder" ("sent", "datetime");
+        CREATE INDEX "idx_reminder_user_id_e5b948" ON "reminder" ("user_id", "datetime");
+        CREATE INDEX "idx_todotask_user_id_d4b1f6" ON "todotask" ("user_id", "done", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_todotask_user_id_d4b1f6";
+        DROP INDEX IF EXISTS "idx_reminder_user_id_e5b948";
+        DROP INDEX IF EXISTS "idx_reminder_sent_27ea29";
+        DROP INDEX IF EXISTS "idx_reminder_claimed_c0c524";
+        DROP INDEX IF EXISTS "idx_reminder_sent_0c4604";
+        DROP INDEX IF EXISTS "idx_birthday_user_id_f53805";"""
+
+
+MODELS_STATE = (
+    "eJztW+9T4jgY/lcYPumMt6Mo4u03cHGXW4QbxbuddZxOoAE6pgmbhFNux/99k/R3m3ZbFa"
+    "TST5Y375smT98kT57En3WbmBCxDx2L8rkJVvWPtZ91DGwoHhJlB7U6WCyCEmngYIyU8zjs"
+    "NWacggkX9ilADAqTCdmEWgtuESyseImQNJKJcLTwLDAtsfVjCQ1OZpDPIRUFt7f1sajXWD"
+    "JIDcuU9ctH+de3qxbf3QmThU34CJkTp/yUeXFvTC2IzEj/nMqU3eCrhbJ1rFkP8wvlK1s4"
+    "NiYELW0c+C9WfE6wH2BhLq0ziCEFHMo3cLqUXZY9ctHxUHB6F7g4rQ3FmHAKloiHIMqJ24"
+    "RgibloDVN9nMm3/PFno3F83GocHp+eNU9arebZ4ZnwVU1KFrWenA4HgDhVKVh6n3uDkewo"
+    "ER/W+eLS8KRiAAdOlMI9ADj+3fJDHY/8PegexFmoe4YA9iA9y4e7BmdlSAB9Pgf0NzB7gT"
+    "GcRddy4Ozm7iZhtsGjgSCe8bn4eXR4mAHhP+2r8y/tqz3htR8FcuAWNZyyKKY2waLyBJap"
+    "Gev7lyxVG0cnrZOz49MTP0N9S1ZiJpPQnftzwuV67ypYCIKFsYKAGphwa7oyiqZbegXPgv"
+    "QNhvC6ES2Wj2nhu4omYNxDQqJSBElN6OaG+eH2YBgkEjPGcEqoZmlORVEfvMvZKFIJrV6S"
+    "k9oKdjMz4aM/RAFP4vhJdJ1bNkxJzUR0DETTDf/gPbxKkr7yDikDsFHvsns9al/+LdttM/"
+    "YDKVDao64saSjrKmbdO42RS7+S2r+90Zea/Fn7Phx0FV6E8RlVbwz8Rt/rsk1gyYlA98EA"
+    "Zhgqz+yZkt8zkt7P/KqaOqpv+7bf9lnb52rnnLFzlnrQ9F4rWHjCUhTpC7H6WjP8Fa4U2j"
+    "3RboAnugXZVcz6S9vC4MatbPuwfvLyxbMGQ5CCB18pC6eR6KToGuSOoNC+Pm9/6tYVlGMw"
+    "uX8A1DQimMoS0iAxi++bLLIbdtwCMJip/steyDYn4dXIlVHw0wVLpPy8L/66kmVMidy4Ap"
+    "knzXZDgpRL1P8Ea6j3tQ0QSkU6HFcmjnjcaJ36AMsfWZBeX7b7fR3dFu9J4JWuInr+pRQP"
+    "mzmkw2aqcNjc1y0o6dNiSLN1z0uYZgZwQy++XkEEVPdSl5rw4Ux5Fpr4Phm+EIWBV0VJIa"
+    "DQli2gL4Thyq2mxEhwYpIXojASVYwAuy8ZCutkTM740JAlf+Ck8yR/eG4PRXpHJ7Qv1HSy"
+    "iA9Hhc4C/YBnLeNvsWNc/yGgeCOHWKOljOBjSgqGQsoCZJZc0v02iiglHlx7l+1v+xG1pD"
+    "8cfPbcQ/Ce94edOKoUyv4/Q6SKRr6CNPUWaSv6YA4xWgXLXxnEKnf6q7SqSqvaCr50UA6t"
+    "yqfkGvIVpuvp/IuGvdZJwW7rzF24/AlUeARWdUIAOIf2Qv51Cr0sjIZMEBDPpjFeFbx+Vz"
+    "G7HMxOfIcijMTzr+iIno6E6UIRMhKOKycVKQn1yHVOVpHKd0oqbciYWFuNJUVFZr1YWEm0"
+    "6U3PfUy7u+0QgiDAemCZfnc7FjHrGhtFuU5+UDvDYT8CaqcXR+3mstO92jtSCAsni0dOng"
+    "IoXWakES+zT5rCcbt20hSnlAVnbk34Rq6rVOtw+nTtXLWjlGg2p+mzdTSqmqz1ulmwq0pA"
+    "m67rRqNKAu0GtF2xwjFBDzC3NLwie96JhVZzTnVHbjOjotIdK90xn+7oH4JrdMfwAXm67i"
+    "hP4rnntV7d0RcR3QtXoR15JR9W8uGWs7JKeHqfwpOpvTaaqY2Y+hujO6+NVAStImgVQYsQ"
+    "tDak1mSuo2duSSY5A4FPdSuvROTrP0iZe3k1r34TCikLBYuqN41mnjv2witVvVFlMbVdDI"
+    "0CILru5QRws1cb/7oeDopebbzBooO3pjXhBzVkMX63nbBmoCh7nb01iO8CYoRTVtAp9s8g"
+    "r7+8PP0CbntAhg=="
+)
@@ -0,0 +1,63 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "backfillcheckpoint" (
+    "name" VARCHAR(100) NOT NULL PRIMARY KEY,
+    "last_id" BIGINT NOT NULL DEFAULT 0,
+    "processed" BIGINT NOT NULL DEFAULT 0,
+    "done" BOOL NOT NULL DEFAULT False,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);"""
+    return """
+        CREATE TABLE IF NOT EXISTS "backfillcheckpoint" (
+    "name" VARCHAR(100) NOT NULL PRIMARY KEY,
+    "last_id" BIGINT NOT NULL DEFAULT 0,
+    "processed" BIGINT NOT NULL DEFAULT 0,
+    "done" INT NOT NULL DEFAULT 0,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "backfillcheckpoint";"""
+
+
+MODELS_STATE = (
+    "eJztXFtz2jgU/isMT8lMt5OS6+4bENJmS2AnIbudZjIeYQvwRJapJDZhO/nvK/kq27KLw9"
+    "VBT4Gjc2Tpk3z06ZPIz7rjWhDRjy1gPo1shNoTaD5NXRuz+h+1n3UMHMg/FHh9qNXBdBr7"
+    "CAMDQ+SFDQN/M+k/pIwAUzxhBBCF3GRBahJ7ymwXcyueISSMrskdbTyOTTNs/5hBg7ljyC"
+    "aQ8IKHR262sQVfIA2/Tp+MkQ2RleiC95cXeiUGm089a3sCyJXnKx44NEwXzRws+0/nbOLi"
+    "KIC3SFjHEEMCGLSkTog2Bj0PTX57uYGRGYwaasUGC47ADDGp0wsiYbpYoMghpV43HfBiII"
+    "jHbMK/fjo6evX7E/fWdxNd+Lt52/7SvD3gXoeiLy4fDH+8ekFRwy979SoBDPjVePjGgCJA"
+    "mWFbWUxb9vgaMzWqUlAK2GBylAU2NMTIxnMqhPZoCVzH4iG//d5oHB+fN46Ozy5OT87PTy"
+    "+OLriv16Js0XkB9q3rz9e9QRJ1YRBQx9BOiWtCSmFJcBNhGt5ceC0XK1JBy3URBFgNbRiS"
+    "QnXIY9YFa9ncmIK2CKV+vyta7VD6A/mwpTDr3d+0OjxDePmBO9ksB8rZ1BLdNgDLAnrJS5"
+    "jtQDWiycgUrlYQ+jH8sC6Ql8y6BAKrj9E8SOgFmA+ubzp3g+bNXwngL5uDjihpeNZ5ynpw"
+    "lsrPUSW1f64HX2ria+17v9fxEHQpGxPvibHf4HtdtAnMmGtg99kAlrT2hNaw8WLpHD1JuV"
+    "4YxBL+DIhlZErchpvnmy1yGk7aAjAYe6MisBWtDEmGTdjEAnMlAQnLimmH7LVSsvFQH/J6"
+    "jRmFJFjFxEfxN7J7LX5MsZIH3+8xl52UXUcXXUKDod4qNdlgjs9nK+lxWxzqdOTmFtbq4K"
+    "7AuSzfzgS+iXgHc3eTMK+LecvJD/PKM1jmztjIv2JTtfHp5Pzk4vjsJJqhkaVoYioInp/7"
+    "F4Qr8N5XsDjpnRpzCAjnAswezY2y0y2/gjdBuoVXeN2IlpuPeeH7iqaQDAIkBCplkFSEVm"
+    "lfvDIM44lEjSEcuUSxNOeiqA7e59nIpxKaLzMnlRXs58yEL9ErWl5EyEavQEj49SRd8Q6p"
+    "IrJBiIOkG3im7HgmpvcbR1VRhx7b7Y7tm7bPeudcsHPOSG5JsLNIX/HV1x7jr3DuoX3N2w"
+    "2wqVqQA8WsO3NsDO6DynYP69dwvoTW+BUk4DlSyuRpxDvJuwZ9SbrdvGs3Lzv11+2IlRK8"
+    "CrkyCX6+YIk8v3DEt3M+ui4FcidOR3dCghRL1H/Ko6c7ByCUi7QcVyWOeNw4P4sAFl+KIL"
+    "27aXa7KrrNn5PBK19FDP0rKR6eLiAdnuYKh6eHqgUlPy1Kmm1wXkIVGSAIvfp6CxHwupe7"
+    "1MiHM9VZaNL7ZLgkCr2wiopCQKAjWkCWhOE2qKbCSDDXcpdEYcCrGAD6VDEU1smY/PdDQZ"
+    "aiFyefJ0Wv5+5QpHd0QrukplNEfBgqdRYYBazm8t27OATkT2QQK7SUAXzJmYJSSFWALJJL"
+    "Ot8GCaUkhOvgpvntMKGWdPu9z6G7BG+722+lUSXwjfeXkpH6/tJW7y9prUprVVqr+gXzii"
+    "i5gnzJdD2ffxHZa50U7KFOg4UrSqDcI7Z6JwSAMehMxV+/MJyFyRATAf7ZMobzktfvNLNb"
+    "gNnxcSjDSEJ/TUfUdESmC2XIiBxXTSpSEeqx0DmZJpXvlFQ6kFK+thozgspkvVRYRbTpTe"
+    "c+qtzdFv4qh6p3t3v/q5yAGSnEy+KTJjlu306a0pSyZOZWhG/kuopeh/PTtX/VjhBXsTnN"
+    "z9bJKJ2s1bpZvKvKQJuv6yajKgLtBrRdvsJRTg8wsxW8ojjvpEJ1ztF35DbzVmjdUeuOi+"
+    "mO0SG4QneUD8jzdUdxEs9Cr/XqjpGIGFy4knbkWj7U8uGOszItPL1P4Un/x5LV/ccSTdA0"
+    "QdMETSZoTUhsc6KiZ0FJITkDsY++lVch8vUvJDS4vLqofiOFVIWCJdWbxukid+y5V65645"
+    "Wl1Hb+apQAMXCvJoCbvdr4512/V/Zq4z3mHXywbJN9qCGbssfdhLUARdHr4q1BeheQIpyi"
+    "gla5H4Osfnl5/R8ON/RK"
+)
@@ -0,0 +1,74 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "todoarchive" (
+    "id" INT NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "text" TEXT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "done_at" TIMESTAMPTZ,
+    "archived_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+COMMENT ON TABLE "todoarchive" IS 'Done tasks moved out of `TodoTask` by the retention job, kept compact and off the hot table.';
+CREATE INDEX IF NOT EXISTS "idx_todoarchive_user_id_064922" ON "todoarchive" ("user_id");
+        ALTER TABLE "todotask" ADD "done_at" TIMESTAMPTZ;"""
+    return """
+        CREATE TABLE IF NOT EXISTS "todoarchive" (
+    "id" INT NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "text" TEXT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "done_at" TIMESTAMP,
+    "archived_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) /* Done tasks moved out of `TodoTask` by the retention job, kept compact and off the hot table. */;
+CREATE INDEX IF NOT EXISTS "idx_todoarchive_user_id_064922" ON "todoarchive" ("user_id");
+        ALTER TABLE "todotask" ADD "done_at" TIMESTAMP;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "todotask" DROP COLUMN "done_at";
+        DROP TABLE IF EXISTS "todoarchive";"""
+
+
+MODELS_STATE = (
+    "eJztXFtz2jgU/isentqZbCcl1903SNI22wR2ErrbaSbjCluAF1uikmjDdvLfV/JVtmUXc3"
+    "fQE3B0jix9ko4+nSPzs+FhG7r0TRtY44HjuhcjaI0n2EGs8Yfxs4GAB/mXEq0DowEmk0RH"
+    "CBjou75ZP9S30vp9ygiwxBMGwKWQi2xILeJMmIMRl6Kp6wohtriig4aJaIqcb1NoMjyEbA"
+    "QJL3h45GIH2fAJ0ujnZGwOHOjaqS74n7zQLzHZbOJLL0aAvPN1xQP7poXdqYdk/cmMjTCK"
+    "DXiLhHQIESSAQVvqhGhj2PNIFLSXCxiZwrihdiKw4QBMXSZ1ek4kLIwEihxS6nfTA0+mC9"
+    "GQjfjPt4eHz0F/kt4GaqILf7fuLj607l5xrdeiL5gPRjBenbCoGZQ9+5UABoJqfHwTQF1A"
+    "menYeUzbzvAaMTWqklEG2HByVAU2EiTIJnMqgvZwCVyH4iG//d5sHh2dNQ+PTs9Pjs/OTs"
+    "4Pz7mu36J80VkJ9u3r99edXhp1IRBQJ9BOCLYgpbAiuCkzDW8hvDZGClfQxtiFAKmhjUwy"
+    "qPa5zbpgreobM9CWodTt3ohWe5R+cwPYMph1Pt22r7iH8P0DV3JYAZTTiS26bQKWB/SSlz"
+    "DHg2pE05YZXO3Q9E30ZV0gL+l1CQR2F7mz0KGXYN67vr2677Vu/0oBf9nqXYmSpi+dZaSv"
+    "TjP+Oa7E+Oe698EQP40v3c6VjyCmbEj8JyZ6vS8N0SYwZdhE+IcJbGnviaRR48XWORhLvl"
+    "4IxBb+AxDbzJXgJi7SzRd5TS8rAQgM/VER2IpWRiTDIWxkg5mSgERl5bRD1lop2Xho9Hm9"
+    "5pRCEu5i4qv4jOV+ix8zrOQh0HssZCdV99F5t9BwqLdKTTbo44vZSnbc5oc6a7m5jbU+uC"
+    "twrsq3c4YLEe9w7m4S5nUxb9n5IV55DsvCGRvr12yqNt8enx2fH50exzM0lpRNTAXBC3z/"
+    "nHCF2vsKFie9E3MGAeFcgDmDmVl1uhVXsBCkW1jC60a02nwsMt9XNEXIIERCoFIFSYVpnc"
+    "7FK8MwmUjU7MMBJoqtuRBFtfE+z0Y+ldzZMnNSWcF+zkz4FC/R6kGEvPUKAgm/nqQrPiHV"
+    "JGwQ4SDFDXxRfjxT03vBUVXUocd2u2O70PFZn5xLTs65kFsa7DzS7/ju6wzRRzjz0b7m7Q"
+    "bIUm3IYcTsZuo5CHwKK9s9rJ+j+RJJkyVIwI84UiZPI95J3jUYhKQvWvcXrcurxvN2gpUS"
+    "vIpwZRr84oCl6+tFI76d/Oi6IpA7kR3diRCk2KL+U6ae7j3guoVIy3Z14ohHzbPTGGDxow"
+    "zS+9vWzY2KbvPn5PAqjiJG+rUMHp7METo8KQwcnrxWbSjFblGK2Yb5EqrwAKHpu4930AV+"
+    "9wq3Gjk5U5+NJntOhkui0ImqqCkEBHqiBWRJGO7CamqMBMM2XhKFHq+iB+i4ZiiskzEF60"
+    "NBluKFU8yT4uW5OxTpBWVol4zplBEf5lbKBcYGq7l89yKSgPyJDCJFLKUHnwqmoGRSFyDL"
+    "wiVXn3upSEkE16vb1ufXqWjJTbfzPlKX4L246bazqBK44P2ltKW+v7TV+0s6VqVjVTpW9Q"
+    "vmFVNyBfmS6Xox/yKy1jop2EODhhtX7EC5RiL1MwSAMehNxGdQGM3CtInlAv7dNvuzitfv"
+    "NLObg9nxcajCSCJ9TUfUdESmC1XIiGxXTypSE+oxV55Mk8oXSio9SCnfW80pcat4vYxZTW"
+    "LTm/Z9VHm6LX0rh6pPt3v/Vk7IjBTBy/JMk2y3b5mmLKWs6LkV5hu5rqL34WJ3HVy1IwQr"
+    "DqfF3jptpZ21Om6WnKpy0BbHddNWNYF2A7FdvsNRTg8QcxS8otzvZEy1z9F35DazKnTcUc"
+    "cd54s7iiR4i1gj5ztsKEKPcvFBWfRR5OOBpPirAGTjEiNoMEDH1PDwd2gbeMoMPDC+Rmn5"
+    "r0Z/ZrARNAgUiTJuZvyL+wfGGE6YYWFvwqs3AOKGg4GvN8LM8NvzppEZubU/bNfy1jt0r2"
+    "9t4c1ddeY1vh6pY8dro+R7HXV8SRxS/NnMAsMomeljwJaHMOQpi6zGjGk9l+MLSwJUuFa9"
+    "bibtXyctoNHRVdNyDs0irfVm8ON0fPjqgrTL6ES8TsRrMqW99xZSuPq//1aWZdQ0dZcXg4"
+    "5W62i1jlZX59gtSBxr1FAw7LCklF+DREe/olQj/vwdEhq+yTdvMlsyqQuLTqeymyfzvHDM"
+    "tQpT2X5Z5uoRXxoVQAzV6wngZt/z+vO+26n6ntcnxDv4YDsWOzBch7LH3YS1BEXR6/LTXf"
+    "Ygl6FJooJ2tTfjV7+9PP8PN3MfIg=="
+)
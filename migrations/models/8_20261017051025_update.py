@@ -0,0 +1,51 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "luminauser" ADD "dm_channel_id" BIGINT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "luminauser" DROP COLUMN "dm_channel_id";"""
+
+
+MODELS_STATE = (
+    "eJztXFtz2jgU/isentqZbCcl1903SNI22wR2ErrbaSbjCluAF1uikmjDdvLfV/JVtmUXc3"
+    "fQE3B0jix9ko4+nSPzs+FhG7r0TRtY44HjuhcjaI0n2EGs8Yfxs4GAB/mXEq0DowEmk0RH"
+    "CBjou75ZP9S30vp9ygiwxBMGwKWQi2xILeJMmIMRl6Kp6wohtriig4aJaIqcb1NoMjyEbA"
+    "QJL3h45GIH2fAJ0ujnZGwOHOjaqS74n7zQLzHZbOJLL0aAvPN1xQP7poXdqYdk/cmMjTCK"
+    "DXiLhHQIESSAQVvqhGhj2PNIFLSXCxiZwrihdiKw4QBMXSZ1ek4kLIwEihxS6nfTA0+mC9"
+    "GQjfjPt4eHz0F/kt4GaqILf7fuLj607l5xrdeiL5gPRjBenbCoGZQ9+5UABoJqfHwTQF1A"
+    "menYeUzbzvAaMTWqklEG2HByVAU2EiTIJnMqgvZwCVyH4iG//d5sHh2dNQ+PTs9Pjs/OTs"
+    "4Pz7mu36J80VkJ9u3r99edXhp1IRBQJ9BOCLYgpbAiuCkzDW8hvDZGClfQxtiFAKmhjUwy"
+    "qPa5zbpgreobM9CWodTt3ohWe5R+cwPYMph1Pt22r7iH8P0DV3JYAZTTiS26bQKWB/SSlz"
+    "DHg2pE05YZXO3Q9E30ZV0gL+l1CQR2F7mz0KGXYN67vr2677Vu/0oBf9nqXYmSpi+dZaSv"
+    "TjP+Oa7E+Oe698EQP40v3c6VjyCmbEj8JyZ6vS8N0SYwZdhE+IcJbGnviaRR48XWORhLvl"
+    "4IxBb+AxDbzJXgJi7SzRd5TS8rAQgM/VER2IpWRiTDIWxkg5mSgERl5bRD1lop2Xho9Hm9"
+    "5pRCEu5i4qv4jOV+ix8zrOQh0HssZCdV99F5t9BwqLdKTTbo44vZSnbc5oc6a7m5jbU+uC"
+    "twrsq3c4YLEe9w7m4S5nUxb9n5IV55DsvCGRvr12yqNt8enx2fH50exzM0lpRNTAXBC3z/"
+    "nHCF2vsKFie9E3MGAeFcgDmDmVl1uhVXsBCkW1jC60a02nwsMt9XNEXIIERCoFIFSYVpnc"
+    "7FK8MwmUjU7MMBJoqtuRBFtfE+z0Y+ldzZMnNSWcF+zkz4FC/R6kGEvPUKAgm/nqQrPiHV"
+    "JGwQ4SDFDXxRfjxT03vBUVXUocd2u2O70PFZn5xLTs65kFsa7DzS7/ju6wzRRzjz0b7m7Q"
+    "bIUm3IYcTsZuo5CHwKK9s9rJ+j+RJJkyVIwI84UiZPI95J3jUYhKQvWvcXrcurxvN2gpUS"
+    "vIpwZRr84oCl6+tFI76d/Oi6IpA7kR3diRCk2KL+U6ae7j3guoVIy3Z14ohHzbPTGGDxow"
+    "zS+9vWzY2KbvPn5PAqjiJG+rUMHp7METo8KQwcnmTDhrZnWiOAEHQrb9o503qd9raxcxfv"
+    "P1JwPExMUcVohKbvPt5BF/j9LtzT5SxYfXb0bEACLolCJ6qiphAQ6IkWkCVhuAurqTESDN"
+    "t4SRR6vIoeoOOaobBOahqsDwUrjRdOMSGNl+fucNEXlApfMnhWxjCZWynpGhus5pbji8i2"
+    "8icyiBRBqx58KpiCkkldgCyLS1197qVCUhFcr25bn1+nwlI33c77SF2C9+Km286iSuCCF8"
+    "XSlvqi2FYviumgoA4K6qDgL5hXTMkV5Eum68X8i8ha66RgDw0ablyxA+UaidRPxQDGoDcR"
+    "n0FhNAvTJpYL+Hfb7M8q3nPUzG4OZsfHoQojifQ1HVHTEZkuVCEjsl09qUhNqMdcCUlNKl"
+    "8oqfQgpXxvNafEreL1MmY1SQJs2vdR5em29PUnqj7d7v3rTyEzUgQvy1N6st2+pfSylLKi"
+    "51aYb+RekN6Hi911cKeREKw4nBZ767SVdtbquFlyqspBWxzXTVvVBNoNxHb5Dkc5PUDMUf"
+    "CKcr+TMdU+R19G3Myq0HFHHXecL+4okuAtYo2c77ChCD3KxQdl0UeRjweS4q8CkI1LjKDB"
+    "AB1Tw8PfoW3gKTPwwPgapeW/Gv2ZwUbQIFAkyriZ8S/uHxhjOGGGhb0Jr94AiBsOBr7eCD"
+    "PDb8+bRmbk1v6wXctb79AFyrWFN3fVmdf4HqqOHa+Nku911PElcUjxrz4LDKNkpo8BWx7C"
+    "kKcsshozpvVcji8sCVDhWvW6mbR/nbSARkdXTcs5NIu01pvBj9Px4Tsi0i6jE/E6Ea/JlP"
+    "beW0jh6j9ZXFmWUdPUXV4MOlqto9U6Wl2dY7cgcaxRQ8Gww5JSfg0SHf2KUo3483dIaPgm"
+    "37zJbMmkLiw6ncpunszzZjfXKkxl+2WZq0d8aVQAMVSvJ4Cbfc/rz/tup+p7Xp8Q7+CD7V"
+    "jswHAdyh53E9YSFEWvy0932YNchiaJCtrV3oxf/fby/D9PHo6y"
+)
@@ -0,0 +1,70 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "discordprofile" (
+    "id" BIGINT NOT NULL PRIMARY KEY,
+    "display_name" VARCHAR(100) NOT NULL,
+    "avatar_url" TEXT NOT NULL,
+    "fetched_at" TIMESTAMPTZ NOT NULL
+);
+COMMENT ON TABLE "discordprofile" IS 'The parts of a Discord user needed to render birthdays, so notifications don''t have to fetch the user.';
+CREATE INDEX IF NOT EXISTS "idx_discordprof_fetched_e147a4" ON "discordprofile" ("fetched_at");"""
+    return """
+        CREATE TABLE IF NOT EXISTS "discordprofile" (
+    "id" BIGINT NOT NULL PRIMARY KEY,
+    "display_name" VARCHAR(100) NOT NULL,
+    "avatar_url" TEXT NOT NULL,
+    "fetched_at" TIMESTAMP NOT NULL
+) /* The parts of a Discord user needed to render birthdays, so notifications don't have to fetch the user. */;
+CREATE INDEX IF NOT EXISTS "idx_discordprof_fetched_e147a4" ON "discordprofile" ("fetched_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "discordprofile";"""
+
+
+MODELS_STATE = (
+    "eJztXFtz2ygU/iuMX7adyXZS57r7Zidpm21idxJ3t9NMRsUStrWRQAWc1tvJf1/Qzbogxf"
+    "JdMU+2D+cg+ECHj3PAvxousZDD3rSh+TCwHedshMwHj9iYN/4EvxoYukh8KdHaAw3oeVMd"
+    "KeCw7/hm/VDfTOv3GafQlE8YQIchIbIQM6ntcZtgIcVjx5FCYgpFGw+nojG2v4+RwckQ8R"
+    "GiouDuXohtbKGfiEU/vQdjYCPHSnXB/xSFfonBJ54vPRtB+s7XlQ/sGyZxxi5O6nsTPiI4"
+    "NhAtktIhwohCjqxEJ2Qbw55HoqC9QsDpGMUNtaYCCw3g2OGJTs+IhEmwRFFAyvxuuvCn4S"
+    "A85CPx8+3+/lPQn2lvAzXZhb9bN2cfWjevhNZr2RciBiMYr05Y1AzKnvxKIIdBNT6+U0Ad"
+    "yLhhW3lM2/bwEnM1qgmjDLDh5KgKbCSYIjudUxG0+wvgOpQP+f2PZvPg4KS5f3B8enR4cn"
+    "J0un8qdP0W5YtOSrBvX76/7PTSqEuBhHoKrUeJiRhDFcFNmWl4C+G1CFa4gjYhDoJYDW1k"
+    "kkG1L2xWBWtV35iBtgylbvdKttpl7LsTwJbBrPP5un0hPITvH4SSzQugHHuW7LYBeR7Qc1"
+    "HCbRepEU1bZnC1QtM30ZdVgbyg16UIWl3sTEKHXoJ57/L64rbXuv6UAv681buQJU1fOslI"
+    "Xx1n/HNcCfjnsvcByJ/ga7dz4SNIGB9S/4lTvd7XhmwTHHNiYPLDgFZi7YmkUePl0jl4SP"
+    "h6KZBL+A9ILSNXQpqkSDdf5DbdrARiOPRHRWIrWxmRDJvykQUnSgISlZXTjqTWUsnGXaMv"
+    "6jXGDNFwFZNf5Wcs91t8n2Eld4HefSE7qbqOzrqEhkO9UWqyRh9fzFay4zY71FnL9S2s9c"
+    "FdgXNVvp0znIt4h3N3nTCvinknnR8WleewLJyxsX7Npmrz7eHJ4enB8WE8Q2NJ2cRUELzA"
+    "988IV6i9q2AJ0usZEwSp4ALcHkyMqtOtuIK5IN3AK7xqRKvNxyLzXUVThgxCJCQqVZBUmN"
+    "ZpX7w0DKcTiRl9NCBUsTQXoqg23uXZKKaSM1lkTior2M2ZiX7Gr2j1IELeegmBhOcn6ZJ3"
+    "SDUJG0Q4JOIGvig/nqnpPeeoKurQY7vZsZ1r+6x3ziU751zILQ12Hul3YvW1h/gjmvhoX4"
+    "p2Q2yqFuQwYnY1dm0MP4eVbR/WT9F8iaTTV5DCH3GkLDmNRCdF11AQkj5r3Z61zi8aT5sJ"
+    "Vp7bzCTU+kTJwPYhzIUsMxp7ZYFLK9D1ErrPhS8bvRECHqScATIAEISPAxIvgBGykAU4AR"
+    "SJEaQgioyyPcAI8J2rbUJZFQMWwb9xMIKPSBoMEDdHgIvKZU1vGpnBXONjF8j5riqquhUZ"
+    "360Iq4oZ6zlQrNMVo31Zu+Vk2V9EtA8+CrCpMaZOHtCeYEZqQNNWdYGzjB1dfOmliFEE2q"
+    "vr1pfXKXJ01e28j9QTIJ9dddsZbH33Mle6Mm25nnSlpqIpKrol+ckEo1Is92m+VbzUO75e"
+    "RPI2cyRKL4+rXh6lL/hPedrk1oWOU4h00q5OYaGD5slxDLD8UQbp7XXr6koVYRPPqUAlIv"
+    "1a5guPZuAPR4Xs4SjLHSzXMEcQY+RU3qfnTOsV4N3EZr14/Unkw6Otj2I0QtN3H2+Q4++G"
+    "irfxyYMvW0vjcpv4bA4CLYhCJ6qiphBQ5MoW0AVhuAmrqTESnFhkQRR6oooeZA81Q2GV1D"
+    "R4PxSsNH5xiglp/HpuDxd9QaffFsyXlTFM7lSKvMQGdYkRrCHkIp7IEVbEBIrjLQmTugC5"
+    "7mCLSdGcZ8PTlvps+EbPhus8oM4D6jzgM8wrpuQK8pWk68X8iya1VknB7hosXLhiByo0pl"
+    "L/9AXkHLme/AwKo1mYNjEdKL5bRn9S8WqDZnYzMDsxDlUYSaSv6YiajiTpQhUykrSrJxWp"
+    "CfWY6QySJpUvlFS6iDGxtlbNe2fMapIEWLfvY8rdbemNZ6be3e78jeeQGSmCl+UpvaTdrq"
+    "X0spSyoudWmK/lKLBeh4vddXCNgVKi2JwWe+u0lXbW6rjZdFeVg7Y4rpu2qgm0a4jtihWO"
+    "CXqAua3gFeV+J2OqfY6+f7Cet0LHHXXccba4o0yCt6g5sh9RQxF6TBbvlUUfZT4eJhSfvX"
+    "ZwTjACHLIHBlzyiCxAxlxeBfgWpeW/gf7EP8hPkUyUCTPwL+nvgQfkcWAS1xPVA4iF4WDg"
+    "640IB3578pcNVv2wbctbb9EBypWFN7fVmdf4HKqOHa+Mku901PElcUj5R35zDGPCTG8DNj"
+    "yEIU+Z523MmNbzdXxhSYAtudYTHyctoNHRUdNyDs0jrdVm8ON0fHhHJLHK6ES8TsRrMqW9"
+    "9wZSuPp/lZeWZdQ0dZtfBh2t1tFqHa2uzrFbiNrmqKFg2GFJKb+GUx19RalG/PkRURbe5J"
+    "s1mZ0wqQuLTqeym0ez3OwWWoWpbL8sc/RIvBoVQAzV6wngeu95/XXb7VS95/UZiw7eWbbJ"
+    "94BjM36/nbCWoCh7Xb67y27kMjRJVtCudjN++cvL0/+Zph5L"
+)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
 import contextlib
 import logging
@@ -7,10 +8,10 @@ import os
 import sys
 
 import discord
-from dotenv import load_dotenv
 from loguru import logger
 
 from lumina.bot import Lumina
+from lumina.constants import Role
 from lumina.health import HealthCheckServer
 from lumina.logging import InterceptHandler
 
@@ -23,14 +24,26 @@ def setup_logger() -> None:
     logger.add("logs/lumina.log", rotation="1 week", retention="1 month", level="INFO")
 
 
-async def main() -> None:
-    async with Lumina() as bot, HealthCheckServer(bot):
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run Lumina.")
+    parser.add_argument(
+        "--role",
+        type=Role,
+        choices=list(Role),
+        default=Role.ALL,
+        help="gateway handles interactions, scheduler delivers reminders and birthdays, all does both",
+    )
+    return parser.parse_args()
+
+
+async def main(role: Role) -> None:
+    async with Lumina(role=role) as bot, HealthCheckServer(bot, port=int(os.getenv("HEALTH_PORT", "8080"))):
         await bot.start(os.environ["DISCORD_TOKEN"])
 
 
 if __name__ == "__main__":
-    load_dotenv()
+    args = parse_args()
     setup_logger()
 
     with contextlib.suppress(KeyboardInterrupt, asyncio.CancelledError):
-        asyncio.run(main())
+        asyncio.run(main(args.role))
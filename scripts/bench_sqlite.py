@@ -0,0 +1,132 @@
+"""Compare how many commands per second SQLite serves with a rollback journal and with `SQLITE_PRAGMAS`.
+
+Each profile gets a fresh database seeded with users, reminders and todos, then replays a mix of the
+queries and writes commands make, several at a time like concurrent interactions do.
+
+Run it from the repository root: `uv run python -m scripts.bench_sqlite`
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+from tortoise import Tortoise
+from tortoise.backends.base.config_generator import expand_db_url
+
+from lumina.db import get_connection_config
+from lumina.models import LuminaUser, Reminder, TodoTask
+from lumina.write_queue import write_queue
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Lumina's SQLite pragmas.")
+    parser.add_argument("--users", type=int, default=1000, help="users to seed")
+    parser.add_argument("--rows-per-user", type=int, default=20, help="reminders and todos to seed for each user")
+    parser.add_argument("--commands", type=int, default=5000, help="commands to replay for each profile")
+    parser.add_argument("--concurrency", type=int, default=20, help="commands in flight at the same time")
+    return parser.parse_args()
+
+
+async def seed(*, users: int, rows_per_user: int) -> None:
+    now = datetime.datetime.now(datetime.UTC)
+    await LuminaUser.bulk_create([LuminaUser(id=user_id) for user_id in range(users)])
+    await Reminder.bulk_create(
+        [
+            Reminder(text="Seeded reminder", datetime=now + datetime.timedelta(minutes=row), user_id=user_id)
+            for user_id in range(users)
+            for row in range(rows_per_user)
+        ],
+        batch_size=1000,
+    )
+    await TodoTask.bulk_create(
+        [
+            TodoTask(text="Seeded todo", done=row % 2 == 0, user_id=user_id)
+            for user_id in range(users)
+            for row in range(rows_per_user)
+        ],
+        batch_size=1000,
+    )
+
+
+async def create_reminder(user: LuminaUser) -> None:
+    now = datetime.datetime.now(datetime.UTC)
+    await write_queue.create(Reminder, text="Benchmark reminder", datetime=now, user=user)
+
+
+async def add_todo(user: LuminaUser) -> None:
+    await write_queue.create(TodoTask, text="Benchmark todo", user=user)
+
+
+async def list_reminders(user: LuminaUser) -> None:
+    await Reminder.pending(user.id)
+
+
+async def list_todos(user: LuminaUser) -> None:
+    await TodoTask.listed(user.id)
+
+
+COMMAND_MIX: tuple[Callable[[LuminaUser], Awaitable[None]], ...] = (
+    *(create_reminder,) * 3,
+    *(add_todo,) * 2,
+    *(list_reminders,) * 3,
+    *(list_todos,) * 2,
+)
+"""The commands replayed in turn, each one after resolving the user like every interaction does."""
+BASELINE_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL"}
+"""SQLite's own defaults, Tortoise switches new connections to WAL unless told otherwise."""
+USER_STRIDE = 7919
+"""A prime, stepping through users by it spreads consecutive commands over the whole table."""
+
+
+async def bench(name: str, connection: dict[str, Any], args: argparse.Namespace) -> float:
+    await Tortoise.init(
+        config={
+            "connections": {"default": connection},
+            "apps": {"models": {"models": ["lumina.models"], "default_connection": "default", "use_tz": True}},
+        }
+    )
+    try:
+        await Tortoise.generate_schemas()
+        await seed(users=args.users, rows_per_user=args.rows_per_user)
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def run(index: int) -> None:
+            async with semaphore:
+                user = await LuminaUser.upsert(index * USER_STRIDE % args.users)
+                await COMMAND_MIX[index % len(COMMAND_MIX)](user)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run(index) for index in range(args.commands)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await Tortoise.close_connections()
+
+    rate = args.commands / elapsed
+    logger.info(f"{name}: {rate:.0f} commands/s ({elapsed:.2f}s for {args.commands})")
+    return rate
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_path = Path(directory) / "baseline.db"
+        tuned_path = Path(directory) / "tuned.db"
+        baseline_config = expand_db_url(f"sqlite://{baseline_path}")
+        baseline_config["credentials"].update(BASELINE_PRAGMAS)
+        baseline = await bench("rollback journal", baseline_config, args)
+        tuned = await bench("tuned", get_connection_config(f"sqlite://{tuned_path}"), args)
+    logger.info(f"SQLITE_PRAGMAS serve {tuned / baseline:.2f}x the commands of a rollback journal with full sync")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from tortoise import Tortoise
+
+from lumina.l10n import translator
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite://:memory:")
+"""Database the tests run against, created before each test and dropped after it."""
+
+
+class QueryRecorder(logging.Handler):
+    """Collects the statements Tortoise logs, every statement sent to the database is logged at debug level."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.queries: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.queries.append(record.getMessage())
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[None]:
+    await Tortoise.init(db_url=TEST_DATABASE_URL, modules={"models": ["lumina.models"]}, use_tz=True, _create_db=True)
+    await Tortoise.generate_schemas()
+    await translator.load()
+    yield
+    await Tortoise._drop_databases()
+
+
+@pytest.fixture
+def queries() -> Iterator[list[str]]:
+    logger = logging.getLogger("tortoise.db_client")
+    recorder = QueryRecorder()
+    level = logger.level
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(recorder)
+    yield recorder.queries
+    logger.removeHandler(recorder)
+    logger.setLevel(level)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+import pytest
+
+from lumina.cogs.schedule import ScheduleCog
+from lumina.models import Birthday, DiscordProfile, LuminaUser
+
+
+class FakeBot:
+    async def dm_user(self, *_: Any, **__: Any) -> object:
+        return object()
+
+
+async def seed_due_birthdays(start: int, count: int) -> None:
+    """Create `count` users with a birthday today, half of them for Discord users whose profile is cached."""
+    today = datetime.datetime.now(datetime.UTC)
+    for user_id in range(start, start + count):
+        user = await LuminaUser.create(id=user_id, timezone=0)
+        if user_id % 2:
+            await Birthday.create(
+                user=user, bday_user_id=0, bday_username=f"friend {user_id}", month=today.month, day=today.day
+            )
+        else:
+            bday_user_id = 10_000 + user_id
+            await DiscordProfile.create(
+                id=bday_user_id, display_name="friend", avatar_url="", fetched_at=datetime.datetime.now(datetime.UTC)
+            )
+            await Birthday.create(user=user, bday_user_id=bday_user_id, month=today.month, day=today.day)
+    await Birthday.filter(user_id__gte=start).update(next_notify_at=today - datetime.timedelta(minutes=1))
+
+
+@pytest.mark.usefixtures("db")
+async def test_birthday_pass_query_count_is_constant(queries: list[str]) -> None:
+    cog = ScheduleCog(FakeBot())  # pyright: ignore[reportArgumentType]
+    counts: list[int] = []
+    for start, count in ((1, 10), (1_000, 200)):
+        await seed_due_birthdays(start, count)
+        queries.clear()
+        await cog.notify_birthdays.coro(cog)
+        counts.append(len(queries))
+        assert await Birthday.filter(next_notify_at__lte=datetime.datetime.now(datetime.UTC)).count() == 0
+
+    assert counts[0] == counts[1], queries
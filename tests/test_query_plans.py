@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from tortoise import connections
+
+from lumina.models import Birthday, Reminder, TodoTask
+from lumina.retention import RETENTION_BATCH_SIZE
+from lumina.scheduler import CATCHUP_CHUNK_SIZE, LOOKAHEAD
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from tortoise.queryset import QuerySet
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+HOT_QUERIES: dict[str, Callable[[], QuerySet]] = {
+    "due_unclaimed_poll": lambda: Reminder.due_unclaimed(NOW + LOOKAHEAD, NOW),
+    "catch_up_first_page": lambda: Reminder.overdue_after(NOW, None).limit(CATCHUP_CHUNK_SIZE),
+    "catch_up_keyset": lambda: Reminder.overdue_after(NOW, (NOW, 1)).limit(CATCHUP_CHUNK_SIZE),
+    "claimed_by": lambda: Reminder.claimed("worker:1"),
+    "reminder_list": lambda: Reminder.pending(1),
+    "reminder_purge": lambda: Reminder.purgeable(NOW).limit(RETENTION_BATCH_SIZE),
+    "todo_list": lambda: TodoTask.listed(1),
+    "todo_list_with_done": lambda: TodoTask.listed(1, include_done=True),
+    "todo_archive": lambda: TodoTask.archivable(NOW).limit(RETENTION_BATCH_SIZE),
+    "birthday_list": lambda: Birthday.owned_by(1),
+    "birthday_due": lambda: Birthday.due(NOW).select_related("user"),
+}
+"""The queries run on every scheduler tick, command or retention pass, built by the same model helpers the code
+calls, each must be served by an index."""
+
+
+@pytest.mark.usefixtures("db")
+@pytest.mark.parametrize("name", HOT_QUERIES)
+async def test_hot_query_uses_index(name: str) -> None:
+    client = connections.get("default")
+    if client.capabilities.dialect != "sqlite":
+        pytest.skip("EXPLAIN QUERY PLAN is SQLite specific")
+
+    sql = HOT_QUERIES[name]().sql(params_inline=True)
+    _, rows = await client.execute_query(f"EXPLAIN QUERY PLAN {sql}")
+    plan = [row["detail"] for row in rows]
+    assert not any(detail.startswith("SCAN") for detail in plan), plan
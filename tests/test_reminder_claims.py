@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+from lumina.models import LuminaUser, Reminder
+from lumina.scheduler import ReminderScheduler
+
+
+@pytest.mark.usefixtures("db")
+async def test_claim_skips_backed_off_and_leased_reminders() -> None:
+    now = datetime.datetime.now(datetime.UTC)
+    past = now - datetime.timedelta(minutes=5)
+    future = now + datetime.timedelta(minutes=5)
+    user = await LuminaUser.create(id=1)
+    due = await Reminder.create(text="due", datetime=past, user=user)
+    backed_off = await Reminder.create(text="backed off", datetime=past, next_attempt_at=future, user=user)
+    leased = await Reminder.create(text="leased", datetime=past, claimed_by="other:1", lease_until=future, user=user)
+
+    scheduler = ReminderScheduler(None)  # pyright: ignore[reportArgumentType]
+    token = await scheduler._claim([due.id, backed_off.id, leased.id])
+    assert await Reminder.claimed(token).values_list("id", flat=True) == [due.id]
+
+    token = await scheduler._claim([backed_off.id], due_by=future)
+    assert await Reminder.claimed(token).values_list("id", flat=True) == [backed_off.id]